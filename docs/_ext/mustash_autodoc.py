@@ -26,10 +26,11 @@
 # The fact that you are presently reading this means that you have had
 # knowledge of the CeCILL-C license and that you accept its terms.
 # *****************************************************************************
-"""Sphinx extensions for autodoc."""
+"""Sphinx extensions for autoapi."""
 
 from __future__ import annotations
 
+from sys import intern
 from typing import TYPE_CHECKING, Any
 
 
@@ -37,6 +38,28 @@ if TYPE_CHECKING:
     from sphinx.application import Sphinx
 
 
+_ATTRIBUTE = intern("attribute")
+_METHOD = intern("method")
+_MODULE = intern("module")
+"""Interned member kinds, so comparisons are pointer compares.
+
+The values Sphinx passes as ``what`` come from literals interned by
+CPython, so comparing against interned candidates usually short-circuits
+on identity without comparing characters.
+"""
+
+_METHODS_NOT_TO_SKIP: frozenset[str] = frozenset(("validate", "copy"))
+"""Method names that should not be skipped on non-pydantic models."""
+
+_MEMBERS_TO_SKIP: frozenset[str] = frozenset((
+    "model_config",
+    "model_fields",
+    "model_computed_fields",
+    "model_post_init",
+))
+"""Pydantic plumbing member names that should always be skipped."""
+
+
 def do_not_skip_special_methods_on_non_pydantic_models(
     app: Sphinx,
     what: str,
@@ -50,16 +73,23 @@ def do_not_skip_special_methods_on_non_pydantic_models(
     This method is mainly here to prevent skipping methods with specific
     names on some non-pydantic objects.
 
-    See `autodoc-skip-member`_ for more information regarding the signature.
+    See `autoapi-skip-member`_ for more information regarding the signature.
 
-    .. _autodoc-skip-member:
-        https://www.sphinx-doc.org/en/master/usage/extensions/autodoc.html
-        #event-autodoc-skip-member
+    .. _autoapi-skip-member:
+        https://sphinx-autoapi.readthedocs.io/en/latest/reference/
+        config.html#event-autoapi-skip-member
     """
-    # "what" is set to "pydantic_model" if a pydantic model, and "class"
-    # otherwise, so we can distinguish using this.
-    if what == "class" and name in ("validate", "copy"):
-        return False
+    # This event fires for every member of every documented object, so
+    # bail out as early as possible for the common cases.
+    if what == _ATTRIBUTE:
+        if name.rsplit(".", 1)[-1] in _MEMBERS_TO_SKIP:
+            return True
+    elif what == _METHOD:
+        short_name = name.rsplit(".", 1)[-1]
+        if short_name in _METHODS_NOT_TO_SKIP:
+            return False
+        if short_name in _MEMBERS_TO_SKIP:
+            return True
 
     return skip
 
@@ -74,22 +104,48 @@ def remove_first_line_in_module_docstring(
 ) -> None:
     """Remove the first line (and empty line) of the docstring if is a module.
 
-    See `autodoc-process-docstring`_ for more information regarding the
+    See `autoapi-process-docstring`_ for more information regarding the
     signature.
 
-    .. _autodoc-process-docstring:
-        https://www.sphinx-doc.org/en/master/usage/extensions/autodoc.html
-        #event-autodoc-process-docstring
+    .. _autoapi-process-docstring:
+        https://sphinx-autoapi.readthedocs.io/en/latest/reference/
+        config.html#event-autoapi-process-docstring
     """
-    if what != "module" or not lines:
+    if what != _MODULE or not lines:
         return
 
-    for i in range(1, len(lines)):
-        if not lines[i]:
-            lines[: i + 1] = []
-            return
+    try:
+        i = lines.index("", 1)
+    except ValueError:
+        lines[:] = []
+    else:
+        del lines[: i + 1]
+
+
+def preload_mustash_modules(
+    app: Sphinx,
+    env: Any,
+    docnames: list[str],
+) -> None:
+    """Import the mustash modules before documents are actually read.
+
+    Due to a weird bug with Sphinx and pydantic, the modules must already
+    be imported when code in the documents runs. Importing them here, rather
+    than at conf.py import time, lets incremental builds with no changed
+    documents skip the import cost entirely.
+
+    See `env-before-read-docs`_ for more information regarding the
+    signature.
+
+    .. _env-before-read-docs:
+        https://www.sphinx-doc.org/en/master/extdev/event_callbacks.html
+        #event-env-before-read-docs
+    """
+    if not docnames:
+        return
 
-    lines[:] = []
+    import mustash.es  # noqa
+    import mustash.processors  # noqa
 
 
 def setup(app: Sphinx) -> None:
@@ -97,11 +153,17 @@ def setup(app: Sphinx) -> None:
 
     :param app: The Sphinx application to set up the extension for.
     """
+    # Run the cheap skip handler before heavier listeners so that skipped
+    # members short-circuit early, and the docstring handler after other
+    # listeners so that it trims the final text.
     app.connect(
-        "autodoc-skip-member",
+        "autoapi-skip-member",
         do_not_skip_special_methods_on_non_pydantic_models,
+        priority=100,
     )
     app.connect(
-        "autodoc-process-docstring",
+        "autoapi-process-docstring",
         remove_first_line_in_module_docstring,
+        priority=900,
     )
+    app.connect("env-before-read-docs", preload_mustash_modules)
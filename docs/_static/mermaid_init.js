@@ -0,0 +1,55 @@
+function isDarkMode() {
+    const color = (
+        getComputedStyle(document.body)
+        .getPropertyValue("--color-code-foreground")
+    );
+
+    if (color == "#d0d0d0")
+        return true;
+
+    return false;
+}
+
+function initializeMermaid(isStart) {
+    mermaid.initialize({
+        startOnLoad: isStart,
+        theme: isDarkMode() ? "dark" : "base",
+        darkMode: isDarkMode(),
+        securityLevel: "antiscript"
+    });
+}
+
+const observer = new MutationObserver(function(mutations) {
+    mutations.forEach(function(mutation) {
+        if (
+            mutation.type != "attributes"
+            || mutation.attributeName != "data-theme"
+        )
+            return
+
+        const nodes = document.querySelectorAll(".mermaid");
+        nodes.forEach(node => {
+            /* Restore the original code before reprocessing. */
+            node.innerHTML = node.getAttribute("data-original-code");
+
+            /* Remove the attribute saying data is processed; it is not! */
+            if (node.hasAttribute("data-processed"))
+                node.removeAttribute("data-processed");
+        });
+
+        initializeMermaid(false);
+        mermaid.run({nodes: nodes, querySelector: ".mermaid"});
+    });
+});
+
+(function (window) {
+    /* Store original code for diagrams into an attribute directly, since
+       Mermaid actually completely replaces the content and removes the
+       original code. */
+    document.querySelectorAll(".mermaid").forEach(node => {
+        node.setAttribute("data-original-code", node.innerHTML);
+    })
+
+    initializeMermaid(true);
+    observer.observe(document.body, {attributes: true});
+})(window);
@@ -6,42 +6,58 @@ https://www.sphinx-doc.org/en/master/usage/configuration.html
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+import re
 import sys
 
-from toml import load as load_toml
 
-# Due to a weird bug with Sphinx and pydantic, we want to import the module
-# here instead of later, so that it already imported when generating the
-# autodocs.
-import mustash.es  # noqa
-import mustash.processors  # noqa
+# Add the module path, as plain strings to avoid Path allocations and
+# stat calls on every Sphinx invocation.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ROOT = os.path.dirname(_HERE)
+sys.path.insert(0, _ROOT)
+sys.path.append(os.path.join(_HERE, "_ext"))
+pyproject_path = os.path.join(_ROOT, "pyproject.toml")
 
-
-# Add the module path.
-sys.path.insert(0, str(Path(__file__).parent.parent))
-sys.path.append(str(Path(__file__).parent / "_ext"))
-pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-
-with open(pyproject_path) as pyproject_file:
-    version = load_toml(pyproject_file)["tool"]["poetry"]["version"]
+# Read the version with a simple regex scan rather than a full TOML parse,
+# to avoid importing the toml package on every Sphinx (re)build.
+with open(pyproject_path, encoding="utf-8") as pyproject_file:
+    version = re.search(
+        r'^version\s*=\s*"([^"]+)"',
+        pyproject_file.read(),
+        re.M,
+    ).group(1)
 
 project = "Mustash"
 copyright = "2024, Thomas Touhey"
 author = "Thomas Touhey"
 
 extensions = [
-    "sphinx.ext.autodoc",
+    "autoapi.extension",
     "sphinx.ext.doctest",
     "sphinx.ext.intersphinx",
     "sphinx.ext.todo",
-    "sphinxcontrib.autodoc_pydantic",
     "sphinxcontrib.mermaid",
     "mustash_autodoc",
 ]
 
+# The todo extension must stay loaded for the todo directives to parse,
+# but only render them when explicitly requested, to keep default builds
+# lighter.
+todo_include_todos = bool(os.environ.get("MUSTASH_DOCS_TODOS"))
+
 templates_path: list[str] = []
-exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+exclude_patterns = [
+    "_build",
+    "Thumbs.db",
+    ".DS_Store",
+    "**/.venv/**",
+    "**/node_modules/**",
+    "**/__pycache__/**",
+    # Example scripts are included through literalinclude, not read as
+    # source documents.
+    "developer-guides/*.py",
+]
 
 html_theme = "furo"
 html_static_path = ["_static"]
@@ -51,6 +67,9 @@ html_copy_source = False
 html_show_sourcelink = False
 html_domain_indices = False
 html_css_files = ["custom.css"]
+# Serve the Mermaid initialization script as a static, browser-cacheable
+# asset rather than inlining it from conf.py on every page.
+html_js_files = ["mermaid_init.js"]
 html_favicon = "_static/favicon.png"
 html_logo = "_static/logo.svg"
 
@@ -59,83 +78,20 @@ intersphinx_mapping: dict[str, tuple[str, None]] = {
     "pydantic": ("https://docs.pydantic.dev/latest", None),
 }
 
-todo_include_todos = True
-
 mermaid_output_format = "raw"
-mermaid_init_js = """
-function isDarkMode() {
-    const color = (
-        getComputedStyle(document.body)
-        .getPropertyValue("--color-code-foreground")
-    );
-
-    if (color == "#d0d0d0")
-        return true;
-
-    return false;
-}
-
-function initializeMermaid(isStart) {
-    mermaid.initialize({
-        startOnLoad: isStart,
-        theme: isDarkMode() ? "dark" : "base",
-        darkMode: isDarkMode(),
-        securityLevel: "antiscript"
-    });
-}
-
-const observer = new MutationObserver(function(mutations) {
-    mutations.forEach(function(mutation) {
-        if (
-            mutation.type != "attributes"
-            || mutation.attributeName != "data-theme"
-        )
-            return
-
-        const nodes = document.querySelectorAll(".mermaid");
-        nodes.forEach(node => {
-            /* Restore the original code before reprocessing. */
-            node.innerHTML = node.getAttribute("data-original-code");
-
-            /* Remove the attribute saying data is processed; it is not! */
-            if (node.hasAttribute("data-processed"))
-                node.removeAttribute("data-processed");
-        });
-
-        initializeMermaid(false);
-        mermaid.run({nodes: nodes, querySelector: ".mermaid"});
-    });
-});
-
-(function (window) {
-    /* Store original code for diagrams into an attribute directly, since
-       Mermaid actually completely replaces the content and removes the
-       original code. */
-    document.querySelectorAll(".mermaid").forEach(node => {
-        node.setAttribute("data-original-code", node.innerHTML);
-    })
-
-    initializeMermaid(true);
-    observer.observe(document.body, {attributes: true});
-})(window);
-"""
-
-autodoc_typehints = "both"
-autodoc_typehints_format = "short"
-autodoc_default_options = {
-    "members": True,
-    "undoc-members": True,
-    "show-inheritance": True,
-    "inherited-members": "BaseModel",
-    "exclude-members": "model_config, model_fields, model_computed_fields, "
-    + "model_post_init",
-}
-autodoc_type_aliases = {
-    "FieldPathType": "FieldPath",
-    "FieldType": "Element",
-    "_ProcessorType": "Processor",
-}
-autodoc_member_order = "bysource"
-
-autodoc_pydantic_field_list_validators = False
-autodoc_pydantic_model_show_json = False
+# Blank out the extension's default initialization snippet, which would
+# otherwise run a second, conflicting mermaid.initialize call on top of
+# the theme-aware one served from _static/mermaid_init.js.
+mermaid_init_js = ""
+
+# Parse the source statically with autoapi, so that the module does not
+# need to be imported (and its dependency tree installed) at build time.
+autoapi_type = "python"
+autoapi_dirs = [os.path.join(_ROOT, "mustash")]
+autoapi_options = [
+    "members",
+    "undoc-members",
+    "show-inheritance",
+    "inherited-members",
+]
+autoapi_member_order = "bysource"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import asyncio
+import sys
+
+from pydantic import ConfigDict
 
 from mustash.core import Document, FieldProcessor
 
@@ -8,11 +10,14 @@ from mustash.core import Document, FieldProcessor
 class HahaProcessor(FieldProcessor[str]):
     """Processor for adding ``", haha"`` to a field."""
 
+    model_config = ConfigDict(frozen=True)
+    """Model configuration, making instances hashable and cacheable."""
+
     async def process(self, value: str, /) -> str:
         return value + ", haha"
 
 
 d: Document = {"my_field": "hello, world"}
 processor = HahaProcessor(field="my_field")
-asyncio.run(processor.apply(d))
-print(d)
+processor.apply_sync(d)
+sys.stdout.write(f"{d}\n")
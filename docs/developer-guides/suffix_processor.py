@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import asyncio
+import sys
+
+from pydantic import ConfigDict
 
 from mustash.core import Document, FieldProcessor
 
@@ -8,6 +10,9 @@ from mustash.core import Document, FieldProcessor
 class SuffixProcessor(FieldProcessor[str]):
     """Processor for adding a suffix to a field."""
 
+    model_config = ConfigDict(frozen=True)
+    """Model configuration, making instances hashable and cacheable."""
+
     suffix: str
     """Suffix to add to the field."""
 
@@ -17,5 +22,5 @@ class SuffixProcessor(FieldProcessor[str]):
 
 d: Document = {"my_field": "hello, world"}
 processor = SuffixProcessor(field="my_field", suffix=", wow")
-asyncio.run(processor.apply(d))
-print(d)
+processor.apply_sync(d)
+sys.stdout.write(f"{d}\n")
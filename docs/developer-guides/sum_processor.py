@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from typing import Self
 
-from pydantic import model_validator
+from pydantic import ConfigDict, model_validator
 
 from mustash.core import Document, FieldPath, Processor
 
@@ -11,6 +12,9 @@ from mustash.core import Document, FieldPath, Processor
 class SumProcessor(Processor):
     """Processor for computing the sum of two fields into a third one."""
 
+    model_config = ConfigDict(frozen=True)
+    """Model configuration, making instances hashable and cacheable."""
+
     first_field: FieldPath
     """Path to the first field."""
 
@@ -32,8 +36,12 @@ class SumProcessor(Processor):
         return self
 
     async def apply(self, document: Document, /) -> None:
-        first = self.first_field.get(document, cls=int)
-        second = self.second_field.get(document, cls=int)
+        first, second = FieldPath.get_many(
+            document,
+            self.first_field,
+            self.second_field,
+            cls=int,
+        )
         self.target_field.set(document, first + second)
 
 
@@ -43,5 +51,7 @@ processor = SumProcessor(
     second_field="animals.cows",
     target_field="animals.total",
 )
-asyncio.run(processor.apply(d))
-print(d)
+with asyncio.Runner() as runner:
+    runner.run(processor.apply(d))
+
+sys.stdout.write(f"{d}\n")
@@ -31,12 +31,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence, Iterable
+import asyncio
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
-import re
 from typing import Annotated, Any, Generic, TypeVar, Union, Self
 
-from annotated_types import Ge, Len
+from annotated_types import Len
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -113,38 +114,95 @@ FieldPathParts = Annotated[tuple[FieldPathPart, ...], Len(min_length=1)]
 
 # Type adapters.
 field_path_parts_type_adapter = TypeAdapter(FieldPathParts)
-index_type_adapter = TypeAdapter(Annotated[int, Ge(0)])
 
-_FIELD_PATH_PART_PATTERN = re.compile(r"([^\.]+)(\.)?")
-"""Pattern for a given path part.
 
-See :py:func:`_get_parts_from_string` for usage of this pattern.
+def _parse_index(part: str, /) -> int:
+    """Parse a list index from a field path part.
+
+    This is equivalent to, but much cheaper than, validating the part
+    through a pydantic type adapter, which list traversals would
+    otherwise pay on every step.
+
+    :param part: Part from which to parse the index.
+    :return: Parsed index.
+    :raises ValueError: The part does not represent a non-negative index.
+    """
+    # isdecimal, not isdigit: the latter also accepts characters such as
+    # superscripts that int() rejects.
+    if not part.isdecimal():
+        raise ValueError(f"Invalid list index: {part}")
+
+    return int(part)
+
+
+@lru_cache(maxsize=512)
+def _get_type_adapter(cls: Any, /) -> TypeAdapter:
+    """Get the type adapter for a given type, with caching.
+
+    Building a type adapter requires building the pydantic core schema
+    for the type, which is expensive; the same few types are used on hot
+    paths such as :py:meth:`FieldPath.get`, so adapters are shared
+    process-wide.
+
+    :param cls: Type for which to get the type adapter.
+    :return: Type adapter.
+    """
+    return TypeAdapter(cls)
+
+
+_MISSING = object()
+"""Sentinel for absent dictionary keys in the path walkers.
+
+Using :py:meth:`dict.get` with this sentinel avoids the exception
+machinery on the absent-key path, which is common with
+``ignore_missing`` workloads.
+"""
+
+_PARTS_CACHE: dict[str, FieldPathParts] = {}
+"""Validated field path parts, cached by raw string.
+
+Paths are instantiated many times with the same strings, e.g. through
+pydantic validators coercing the same strings on every processor
+instantiation; on cache hit, both the parsing and the pydantic
+validation of the parts are skipped.
 """
 
+_PARTS_CACHE_MAX_SIZE = 4096
+"""Maximum number of entries in the parts cache."""
 
-def _get_parts_from_string(raw: str, /) -> Sequence[str]:
+
+def _get_parts_from_string(raw: str, /) -> tuple[str, ...]:
     """Get field path parts from a string.
 
     :param raw: Raw string from which to get field path parts.
     :return: Field path parts.
     """
-    left = raw
-    parts: list[str] = []
+    parts = tuple(raw.split("."))
+    if not raw or "" in parts:
+        # Either the path is empty, or it contains an empty part, i.e.
+        # it starts or ends with a dot separator, or contains two
+        # consecutive dot separators; in either case, the field
+        # is not valid.
+        raise ValueError(f"Invalid field path: {raw}")
 
-    while left:
-        match = _FIELD_PATH_PART_PATTERN.match(left)
-        if match is None:
-            raise ValueError(f"Invalid field path: {raw}")
+    return parts
 
-        left = left[match.end() :]
-        if bool(left) != (match[2] == "."):
-            # Either there is no string left and the path ends with a dot
-            # separator, or there is string left but the path does not
-            # end with a dot separator; in either case, the field
-            # is not valid.
-            raise ValueError(f"Invalid field path: {raw}")
 
-        parts.append(match[1])
+def _get_validated_parts_from_string(raw: str, /) -> FieldPathParts:
+    """Get validated field path parts from a string, with caching.
+
+    :param raw: Raw string from which to get field path parts.
+    :return: Validated field path parts.
+    """
+    parts = _PARTS_CACHE.get(raw)
+    if parts is None:
+        parts = field_path_parts_type_adapter.validate_python(
+            _get_parts_from_string(raw),
+        )
+        if len(_PARTS_CACHE) >= _PARTS_CACHE_MAX_SIZE:
+            _PARTS_CACHE.clear()
+
+        _PARTS_CACHE[raw] = parts
 
     return parts
 
@@ -177,11 +235,30 @@ class FieldPath:
         MyModel(field=FieldPath('hello.world'))
     """
 
-    __slots__ = ("_parts",)
+    __slots__ = ("_parts", "_ops", "_str", "_hash")
 
     _parts: FieldPathParts
     """Parts of the path."""
 
+    _str: str
+    """Dotted string representation of the path.
+
+    Since paths are immutable, this is computed once at construction
+    rather than on every ``str()``, ``repr()`` or ``hash()`` call.
+    """
+
+    _hash: int
+    """Hash of the path, computed once at construction."""
+
+    _ops: tuple[tuple[int | None, str], ...]
+    """Pre-compiled access program for the path.
+
+    Each element is a ``(index, part)`` couple, where ``index`` is the
+    part parsed as a list index when it looks like one, and
+    :py:data:`None` otherwise. This avoids re-parsing indices on every
+    traversal of the path.
+    """
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls: type[FieldPathType],
@@ -218,21 +295,53 @@ class FieldPath:
         :return: Obtained field path.
         """
         if isinstance(value, str):
-            return cls(_get_parts_from_string(value))
+            return cls(value)
         if isinstance(value, cls):
-            return cls(value.parts)
+            return cls._from_trusted_parts(value._parts)
         raise TypeError()  # pragma: no cover
 
+    @classmethod
+    def _from_trusted_parts(
+        cls: type[FieldPathType],
+        parts: FieldPathParts,
+        /,
+    ) -> FieldPathType:
+        """Create a field path from already validated parts.
+
+        This bypasses the pydantic validation of the parts, for internal
+        callers that can guarantee the provided parts are already valid,
+        e.g. because they come from an existing path.
+
+        :param parts: Validated parts.
+        :return: Field path.
+        """
+        self = object.__new__(cls)
+        self._parts = parts
+        self._compile()
+        return self
+
+    def _compile(self, /) -> None:
+        """Compute the derived attributes from the parts."""
+        # isdecimal, not isdigit: the latter also accepts characters
+        # such as superscripts that int() rejects, and those are valid
+        # dictionary keys.
+        self._ops = tuple(
+            (int(part) if part.isdecimal() else None, part)
+            for part in self._parts
+        )
+        self._str = ".".join(self._parts)
+        self._hash = hash(self._str)
+
     @property
     def parent(self: FieldPathType, /) -> FieldPathType:
         """Get the field path parent.
 
         :return: Parent.
         """
-        if len(self.parts) == 1:
+        if len(self._parts) == 1:
             return self
 
-        return self.__class__(self.parts[:-1])
+        return self.__class__._from_trusted_parts(self._parts[:-1])
 
     @property
     def parts(self, /) -> tuple[FieldPathPart, ...]:
@@ -244,50 +353,74 @@ class FieldPath:
 
     def __init__(self, path: FieldPath | str | Iterable[str], /) -> None:
         if isinstance(path, FieldPath):
-            raw_parts: Iterable[str] = path.parts
+            self._parts = path._parts
         elif isinstance(path, str):
-            raw_parts = tuple(_get_parts_from_string(path))
+            self._parts = _get_validated_parts_from_string(path)
         else:
-            raw_parts = path
+            self._parts = field_path_parts_type_adapter.validate_python(
+                tuple(path),
+            )
 
-        self._parts = field_path_parts_type_adapter.validate_python(raw_parts)
+        self._compile()
 
     def __eq__(self, other: Any, /) -> bool:
+        if isinstance(other, FieldPath):
+            return self._parts == other._parts
+        if isinstance(other, str):
+            # Invalid paths can never equal the cached dotted string, as
+            # the latter is always a valid path.
+            return self._str == other
+
         try:
             other = FieldPath(other)
         except (ValueError, TypeError):
             return False
 
-        return self.parts == other.parts
+        return self._parts == other._parts
 
     def __contains__(self, other: Any, /) -> bool:
-        try:
-            other = FieldPath(other)
-        except (ValueError, TypeError):
-            return False
-
         # NOTE: We consider that a path contains itself, i.e. if a == b,
         # then a in b.
-        return other._parts[: len(self._parts)] == self._parts
+        if isinstance(other, FieldPath):
+            raw = other._str
+        elif isinstance(other, str):
+            if ".." in other or other.endswith("."):
+                # Invalid paths could otherwise pass the prefix test
+                # below, e.g. "a.b..c" against "a.b".
+                return False
+
+            raw = other
+        else:
+            try:
+                raw = FieldPath(other)._str
+            except (ValueError, TypeError):
+                return False
+
+        return raw == self._str or raw.startswith(self._str + ".")
 
     def __str__(self, /) -> str:
-        return ".".join(self.parts)
+        return self._str
 
     def __repr__(self, /) -> str:
-        return f"{self.__class__.__name__}({'.'.join(self.parts)!r})"
+        return f"{self.__class__.__name__}({self._str!r})"
 
     def __truediv__(self: FieldPathType, other: Any, /) -> FieldPathType:
+        # Both operands carry already validated parts, so the joined
+        # path can be built from a plain tuple concatenation without
+        # re-validating.
         if isinstance(other, FieldPath):
-            return self.__class__([*self.parts, *other.parts])
+            return self.__class__._from_trusted_parts(
+                self._parts + other._parts,
+            )
         if isinstance(other, str):
-            return self.__class__(
-                [*self.parts, *_get_parts_from_string(other)],
+            return self.__class__._from_trusted_parts(
+                self._parts + _get_validated_parts_from_string(other),
             )
 
         raise TypeError()  # pragma: no cover
 
     def __hash__(self, /):
-        return hash(".".join(self.parts))
+        return self._hash
 
     @override
     def get(  # noqa: D102
@@ -374,41 +507,142 @@ class FieldPath:
         :raises KeyError: The key was not provided, and the value did not
             exist.
         """
-        for i, part in enumerate(self._parts):
-            if isinstance(element, dict):
-                try:
-                    element = element[part]
-                except KeyError as exc:
-                    if not isinstance(default, NoValueType):
-                        return default
+        parts = self._parts
+        if len(parts) == 1 and isinstance(element, dict):
+            # Fast path for the most common case of a single-part path
+            # into a dictionary, avoiding the generic walk entirely.
+            value = element.get(parts[0], _MISSING)
+            if value is _MISSING:
+                if default is not NO_VALUE:
+                    return default
 
-                    raise KeyError(".".join(self._parts[: i + 1])) from exc
-            elif isinstance(element, list):
-                try:
-                    index = index_type_adapter.validate_python(part)
-                except ValueError as exc:
-                    if not isinstance(default, NoValueType):
+                raise KeyError(parts[0])
+
+            if cls is not None:
+                value = _get_type_adapter(cls).validate_python(value)
+
+            return value
+
+        for i, (index, part) in enumerate(self._ops):
+            if isinstance(element, dict):
+                value = element.get(part, _MISSING)
+                if value is _MISSING:
+                    if default is not NO_VALUE:
                         return default
 
-                    raise KeyError(".".join(self._parts[: i + 1])) from exc
+                    raise KeyError(".".join(self._parts[: i + 1]))
 
+                element = value
+            elif isinstance(element, list) and index is not None:
                 try:
                     element = element[index]
                 except IndexError as exc:
-                    if not isinstance(default, NoValueType):
+                    if default is not NO_VALUE:
                         return default
 
                     raise KeyError(".".join(self._parts[: i + 1])) from exc
-            elif not isinstance(default, NoValueType):
+            elif default is not NO_VALUE:
                 return default
             else:
                 raise KeyError(".".join(self._parts[: i + 1]))
 
         if cls is not None:
-            element = TypeAdapter(cls).validate_python(element)
+            element = _get_type_adapter(cls).validate_python(element)
 
         return element
 
+    def _get_fast(self, element: Element, /) -> Element:
+        """Get the value in a document element using the path.
+
+        This is a fast path for the common case where the path only
+        traverses dictionaries and every key is present, using direct
+        subscripting per segment. If the assumption does not hold, e.g.
+        a list is found on the way or a key is missing, it falls back to
+        the general :py:meth:`get` walker.
+
+        :param element: Element from which to get the value.
+        :return: Found value.
+        :raises KeyError: The value did not exist.
+        """
+        current = element
+        try:
+            for part in self._parts:
+                current = current[part]  # type: ignore[index]
+        except (KeyError, TypeError, IndexError):
+            return self.get(element)
+
+        return current
+
+    @staticmethod
+    def get_many(
+        element: Element,
+        /,
+        *paths: FieldPath | str | Iterable[str],
+        cls: type | None = None,
+    ) -> list[Any]:
+        """Get the values at several paths in a document element.
+
+        Paths sharing a common prefix, such as ``animals.chickens`` and
+        ``animals.cows``, only traverse the shared intermediate elements
+        once:
+
+        .. doctest::
+
+            >>> document = {"animals": {"chickens": 4, "cows": 7}}
+            >>> FieldPath.get_many(
+            ...     document,
+            ...     "animals.chickens",
+            ...     "animals.cows",
+            ... )
+            [4, 7]
+
+        :param element: Element from which to get the values.
+        :param paths: Paths at which to get the values.
+        :param cls: Optional type to validate the obtained values with,
+            using pydantic.
+        :return: Found values, in the order of the provided paths.
+        :raises KeyError: A value did not exist at one of the paths.
+        """
+        cache: dict[tuple[str, ...], Element] = {}
+        adapter = _get_type_adapter(cls) if cls is not None else None
+        values: list[Any] = []
+
+        for raw_path in paths:
+            parts = FieldPath(raw_path).parts
+
+            # Resume from the deepest prefix already traversed for a
+            # previous path, if any.
+            index = len(parts)
+            while index > 0 and parts[:index] not in cache:
+                index -= 1
+
+            current = cache[parts[:index]] if index > 0 else element
+            for i in range(index, len(parts)):
+                part = parts[i]
+                if isinstance(current, dict):
+                    try:
+                        current = current[part]
+                    except KeyError as exc:
+                        raise KeyError(".".join(parts[: i + 1])) from exc
+                elif isinstance(current, list):
+                    try:
+                        current = current[
+                            _parse_index(part)
+                        ]
+                    except (ValueError, IndexError) as exc:
+                        raise KeyError(".".join(parts[: i + 1])) from exc
+                else:
+                    raise KeyError(".".join(parts[: i + 1]))
+
+                cache[parts[: i + 1]] = current
+
+            if adapter is not None:
+                values.append(adapter.validate_python(current))
+            else:
+                values.append(current)
+
+        return values
+
     def set(
         self,
         element: Element,
@@ -434,33 +668,30 @@ class FieldPath:
         :param override: Whether to override the field if exists, or not.
         :raises KeyError: A non-indexable object was found in the way.
         """
-        for i, part in enumerate(self._parts[:-1]):
+        parts = self._parts
+        if len(parts) == 1 and isinstance(element, dict):
+            if override or parts[0] not in element:
+                element[parts[0]] = value
+
+            return
+
+        for i, (index, part) in enumerate(self._ops[:-1]):
             if isinstance(element, dict):
                 element = element.setdefault(part, {})
             elif isinstance(element, list):
-                try:
-                    index = index_type_adapter.validate_python(part)
-                except ValueError as exc:
-                    raise KeyError(".".join(self._parts[: i + 1])) from exc
-
-                if index >= len(element):
+                if index is None or index >= len(element):
                     raise KeyError(".".join(self._parts[: i + 1]))
 
                 element = element[index]
             else:
                 raise KeyError(".".join(self._parts[: i + 1]))
 
-        part = self._parts[-1]
+        index, part = self._ops[-1]
         if isinstance(element, dict):
             if part not in element or override:
                 element[part] = value
         elif isinstance(element, list):
-            try:
-                index = index_type_adapter.validate_python(part)
-            except ValueError as exc:
-                raise KeyError(".".join(self._parts)) from exc
-
-            if index >= len(element):
+            if index is None or index >= len(element):
                 raise KeyError(".".join(self._parts))
 
             element[index] = value
@@ -483,38 +714,36 @@ class FieldPath:
         :param element: Element at which to delete the value.
         :raises KeyError: A non-indexable object was found in the way.
         """
-        for i, part in enumerate(self._parts[:-1]):
+        parts = self._parts
+        if len(parts) == 1 and isinstance(element, dict):
+            if parts[0] not in element:
+                raise KeyError(parts[0])
+
+            del element[parts[0]]
+            return
+
+        for i, (index, part) in enumerate(self._ops[:-1]):
             if isinstance(element, dict):
                 try:
                     element = element[part]
                 except KeyError as exc:
                     raise KeyError(".".join(self._parts[: i + 1])) from exc
             elif isinstance(element, list):
-                try:
-                    index = index_type_adapter.validate_python(part)
-                except ValueError as exc:
-                    raise KeyError(".".join(self._parts[: i + 1])) from exc
-
-                if index >= len(element):
+                if index is None or index >= len(element):
                     raise KeyError(".".join(self._parts[: i + 1]))
 
                 element = element[index]
             else:
                 raise KeyError(".".join(self._parts[: i + 1]))
 
-        part = self._parts[-1]
+        index, part = self._ops[-1]
         if isinstance(element, dict):
             if part not in element:
                 raise KeyError(".".join(self._parts))
 
             del element[part]
         elif isinstance(element, list):
-            try:
-                index = index_type_adapter.validate_python(part)
-            except ValueError as exc:
-                raise KeyError(".".join(self._parts)) from exc
-
-            if index >= len(element):
+            if index is None or index >= len(element):
                 raise KeyError(".".join(self._parts))
 
             del element[index]
@@ -528,6 +757,17 @@ class Condition(BaseModel, ABC):
     model_config = ConfigDict(extra="forbid")
     """Model configuration."""
 
+    _compiled: Annotated[
+        Callable[[Document], bool] | None,
+        PrivateAttr(default=None),
+    ]
+    """Compiled form of the condition, if available.
+
+    Subclasses may store a compiled callable here, e.g. from
+    :py:meth:`precompile`; the pipeline then calls it directly instead
+    of going through :py:meth:`verify` for every document.
+    """
+
     @abstractmethod
     def verify(self, document: Document, /) -> bool:
         """Verify whether the condition is true or not.
@@ -536,6 +776,14 @@ class Condition(BaseModel, ABC):
         :return: Whether the condition is verified or not.
         """
 
+    def precompile(self, /) -> None:
+        """Precompile the condition, if supported.
+
+        Subclasses whose verification includes document-independent work,
+        such as parsing a script, may override this method to do that
+        work once and store the result in :py:attr:`_compiled`.
+        """
+
 
 class PainlessCondition(Condition):
     """Condition written in Painless.
@@ -591,6 +839,30 @@ class Processor(BaseModel, ABC):
         :param document: Document to which to apply the processor.
         """
 
+    def apply_sync(self, document: Document, /) -> None:
+        """Apply the processor to the document synchronously, in-place.
+
+        Most processors are CPU-only: their :py:meth:`apply` coroutine
+        never actually awaits anything. For such processors, this method
+        drives the coroutine to completion directly, without the cost of
+        creating an event loop per document.
+
+        :param document: Document to which to apply the processor.
+        :raises RuntimeError: The processor has awaited an asynchronous
+            operation, and requires an event loop to be applied.
+        """
+        coroutine = self.apply(document)
+        try:
+            coroutine.send(None)
+        except StopIteration:
+            return
+
+        coroutine.close()
+        raise RuntimeError(
+            "Processor has awaited an asynchronous operation; it must be "
+            + "applied using an event loop.",
+        )
+
 
 class Pipeline(BaseModel):
     """Pipeline, as a set of processors and metadata."""
@@ -616,24 +888,28 @@ class Pipeline(BaseModel):
         :param document: Document to which the processors will apply.
         """
         for processor in processors:
-            if (
-                processor.condition is not None
-                and not processor.condition.verify(document)
-            ):
-                continue
+            # Hoist the attribute reads into locals, as every pydantic
+            # model attribute access pays dictionary lookups; the common
+            # no-failure path only reads the condition once.
+            condition = processor.condition
+            if condition is not None:
+                compiled = condition._compiled
+                if compiled is not None:
+                    if not compiled(document):
+                        continue
+                elif not condition.verify(document):
+                    continue
 
             try:
                 await processor.apply(document)
             except DropException:
                 raise
             except Exception as exc:
+                on_failure = processor.on_failure
                 if processor.ignore_failure:
                     pass
-                elif processor.on_failure is not None:
-                    await self._apply_processors(
-                        processor.on_failure,
-                        document,
-                    )
+                elif on_failure is not None:
+                    await self._apply_processors(on_failure, document)
                 else:
                     raise PipelineFailureException(
                         document=document,
@@ -648,6 +924,51 @@ class Pipeline(BaseModel):
         """
         await self._apply_processors(self.processors, document)
 
+    async def apply_many(
+        self,
+        documents: Iterable[Document],
+        /,
+        *,
+        concurrency: int = 32,
+    ) -> None:
+        """Apply the pipeline to several documents concurrently, in-place.
+
+        With processors awaiting input/output operations, such as network
+        enrichments, processing documents one at a time serializes the
+        latencies; this method overlaps them instead.
+
+        :param documents: Documents to which to apply the pipeline.
+        :param concurrency: Maximum number of documents to process
+            concurrently.
+        """
+        processors = self.processors
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def apply_to_document(document: Document, /) -> None:
+            async with semaphore:
+                await self._apply_processors(processors, document)
+
+        await asyncio.gather(
+            *(apply_to_document(document) for document in documents),
+        )
+
+
+_FIELD_PROCESSOR_TYPE_ADAPTERS: dict[type, TypeAdapter] = {}
+"""Type adapters for field processor subclasses, keyed by subclass.
+
+All instances of a given subclass share the same generic parameter, so
+both the reflection extracting it and the adapter built from it only
+need to run once per subclass rather than once per instance.
+"""
+
+_ANY_TYPE_ADAPTER = TypeAdapter(Any)
+"""Type adapter accepting any value.
+
+Used for field processors that do not parameterize the field type and
+fall back on :py:data:`Element`; validating against the recursive
+element schema would accept the same values at a much higher cost.
+"""
+
 
 class FieldProcessor(Processor, Generic[FieldType]):  # type: ignore
     """Processor that processes a field, expected to be a given type.
@@ -688,14 +1009,25 @@ class FieldProcessor(Processor, Generic[FieldType]):  # type: ignore
         not the same as the source field.
         """
         if self.target_field == self.field:
-            self.target_field = None
+            # Bypass pydantic's __setattr__, so that the normalization
+            # also works on frozen subclasses.
+            object.__setattr__(self, "target_field", None)
+
+        adapter = _FIELD_PROCESSOR_TYPE_ADAPTERS.get(type(self))
+        if adapter is None:
+            generic_type = get_generic_arg(
+                FieldProcessor,
+                self,
+                default=Element,  # type: ignore
+            )
+            if generic_type is Element:
+                adapter = _ANY_TYPE_ADAPTER
+            else:
+                adapter = TypeAdapter(generic_type)
 
-        generic_type = get_generic_arg(
-            FieldProcessor,
-            self,
-            default=Element,  # type: ignore
-        )
-        self._type_adapter = TypeAdapter(generic_type)
+            _FIELD_PROCESSOR_TYPE_ADAPTERS[type(self)] = adapter
+
+        self._type_adapter = adapter
 
         return self
 
@@ -705,7 +1037,7 @@ class FieldProcessor(Processor, Generic[FieldType]):  # type: ignore
         :param document: Document to which to apply the processor.
         """
         try:
-            value = self.field.get(document)
+            value = self.field._get_fast(document)
         except KeyError:
             if self.ignore_missing:
                 return
@@ -721,6 +1053,37 @@ class FieldProcessor(Processor, Generic[FieldType]):  # type: ignore
         if self.remove_if_successful and self.target_field is not None:
             self.field.delete(document)
 
+    def process_batch(self, values: list, /) -> list:
+        """Process several values synchronously.
+
+        Most field processors are CPU-only: their :py:meth:`process`
+        coroutine never actually awaits anything. This method drives the
+        coroutine to completion directly for every value, paying neither
+        an event loop nor a per-value document traversal.
+
+        :param values: Values to process.
+        :return: Processed values, in the order of the provided values.
+        :raises RuntimeError: The processor has awaited an asynchronous
+            operation, and requires an event loop to be applied.
+        """
+        validate = self._type_adapter.validate_python
+        results: list[Element] = []
+
+        for value in values:
+            coroutine = self.process(validate(value))
+            try:
+                coroutine.send(None)
+            except StopIteration as exc:
+                results.append(exc.value)
+            else:
+                coroutine.close()
+                raise RuntimeError(
+                    "Processor has awaited an asynchronous operation; it "
+                    + "must be applied using an event loop.",
+                )
+
+        return results
+
     @abstractmethod
     async def process(self, value: FieldType, /) -> Element:
         """Process the field into the expected type.
@@ -31,61 +31,170 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from copy import deepcopy
+from functools import lru_cache
+from json import dumps as json_dumps
+from operator import attrgetter
 import re
-from typing import Annotated, Any, Literal, TypeVar, Union
+from sys import intern
+from threading import Lock
+from typing import TYPE_CHECKING, Annotated, Any, Literal, TypeVar, Union
 
 from annotated_types import Ge, Lt
 from dissec.patterns import Pattern as DissectPattern
 from pydantic import (
     BaseModel,
     ConfigDict,
+    Discriminator,
     Field,
+    PrivateAttr,
     StringConstraints,
+    Tag,
     TypeAdapter,
     create_model,
+    field_validator,
     model_validator,
 )
 from typing_extensions import TypeAliasType
 
 from .core import Element, PainlessCondition, Pipeline, Processor
-from .processors import (
-    AppendProcessor,
-    BooleanProcessor,
-    BytesProcessor,
-    CSVProcessor,
-    CommunityIDProcessor,
-    CopyProcessor,
-    DateProcessor,
-    FloatingPointProcessor,
-    IPAddressProcessor,
-    IntegerProcessor,
-    JsonProcessor,
-    KeepProcessor,
-    LowercaseProcessor,
-    RegexpSplitProcessor,
-    RemoveProcessor,
-    SetProcessor,
-    SortProcessor,
-    StringProcessor,
-    TrimProcessor,
-    URIPartsProcessor,
-    URLDecodeProcessor,
-    UppercaseProcessor,
-    UserAgentProcessor,
-)
-from .time import (
-    FallbackDateTimeFormatter,
-    ISO8601DateTimeFormatter,
-    JavaDateTimeFormatter,
-    ESTAI64NDateTimeFormatter,
-    UNIXDateTimeFormatter,
-    UNIXMSDateTimeFormatter,
-)
+
+
+if TYPE_CHECKING:
+    from .time import DateTimeFormatter, JavaDateTimeFormatter
+
+
+@lru_cache(maxsize=1)
+def _processors() -> Any:
+    """Get the :py:mod:`mustash.processors` module, imported lazily.
+
+    The processor classes are only needed when an ElasticSearch pipeline
+    is actually converted; callers that only validate pipelines never
+    pay for importing them.
+    """
+    from . import processors
+
+    return processors
+
+
+@lru_cache(maxsize=1)
+def _time() -> Any:
+    """Get the :py:mod:`mustash.time` module, imported lazily."""
+    from . import time
+
+    return time
+
+
+_parse_dissect_pattern_cached = lru_cache(maxsize=512)(DissectPattern.parse)
+"""Parse a dissect pattern, with caching.
+
+Pipelines parsing the same kind of logs commonly repeat dissect
+templates across processors; caching lets identical templates share one
+parsed pattern.
+"""
+
+_compile_pattern_cached = lru_cache(maxsize=1024)(re.compile)
+"""Compile a regular expression, with caching.
+
+Pipelines commonly repeat the same separator and split patterns across
+many processors; caching lets them all share a single compiled pattern
+object.
+"""
+
+
+@lru_cache(maxsize=1)
+def _named_date_formatters() -> dict[str, DateTimeFormatter]:
+    """Get the shared formatter instances for the named date formats.
+
+    These formatters are stateless, so a single instance of each can be
+    shared by every converted date processor instead of allocating new
+    ones per conversion. The table is built lazily so that importing the
+    module does not import the formatters.
+
+    :return: Formatters by format name.
+    """
+    time = _time()
+    return {
+        "ISO8601": time.ISO8601DateTimeFormatter(),
+        "UNIX": time.UNIXDateTimeFormatter(),
+        "UNIX_MS": time.UNIXMSDateTimeFormatter(),
+        "TAI64N": time.ESTAI64NDateTimeFormatter(),
+    }
+
+
+@lru_cache(maxsize=256)
+def _get_java_date_formatter(
+    pattern: str,
+    locale: str,
+    /,
+) -> JavaDateTimeFormatter:
+    """Get a Java date and time formatter, with caching.
+
+    Most pipelines share a handful of patterns, usually including the
+    default output format, so repeated conversions collapse to a single
+    shared formatter per pattern and locale couple. The locale takes
+    part in the cache key so that, once the formatter supports locales,
+    cached entries stay correct.
+
+    :param pattern: Java time pattern for the formatter.
+    :param locale: Locale with which the formatter is requested.
+    :return: Formatter.
+    """
+    return _time().JavaDateTimeFormatter(pattern=pattern)
 
 
 _ProcessorType = TypeVar("_ProcessorType", bound=Processor)
 
+_BUILD_ATTRS = attrgetter("on_failure", "_common_kwargs")
+"""Batch reader for the attributes used by :py:meth:`ESProcessor.build`.
+
+A single C-level attrgetter call replaces separate attribute load
+bytecodes per conversion.
+"""
+
+# Interned default field names shared by the network-related processors,
+# so that dictionary lookups keyed on them hit the interned-string fast
+# path of identity comparison.
+_F_SOURCE_IP = intern("source.ip")
+_F_SOURCE_PORT = intern("source.port")
+_F_DESTINATION_IP = intern("destination.ip")
+_F_DESTINATION_PORT = intern("destination.port")
+_F_IANA_NUMBER = intern("network.iana_number")
+_F_ICMP_TYPE = intern("icmp.type")
+_F_ICMP_CODE = intern("icmp.code")
+_F_TRANSPORT = intern("network.transport")
+_F_COMMUNITY_ID = intern("network.community_id")
+_F_NETWORK_DIRECTION = intern("network.direction")
+
+_GEOIP_DEFAULT_PROPERTIES: tuple[str, ...] = (
+    "continent_name",
+    "country_iso_code",
+    "country_name",
+    "region_iso_code",
+    "region_name",
+    "city_name",
+    "location",
+)
+"""Default properties for the GeoIP processor.
+
+Kept as a module-level tuple so instantiations only pay a shallow list
+allocation for the default, rather than deep-copying a mutable class
+default.
+"""
+
+_SET_SECURITY_USER_DEFAULT_PROPERTIES: tuple[str, ...] = (
+    "username",
+    "roles",
+    "email",
+    "full_name",
+    "metadata",
+    "api_key",
+    "realm",
+    "authentication_type",
+)
+"""Default properties for the set security user processor."""
+
 
 class _ESProcessorWrapper(BaseModel):
     """ElasticSearch processor wrapper.
@@ -96,6 +205,81 @@ class _ESProcessorWrapper(BaseModel):
     value: ESProcessor
     """Actual processor being run."""
 
+    @classmethod
+    def from_trusted(cls, value: ESProcessor, /) -> _ESProcessorWrapper:
+        """Wrap an already validated processor without re-validation.
+
+        This is reserved for callers whose processor comes out of a
+        pydantic-validated tree, e.g. loaders assembling failure chains
+        out of processors the parser has already checked; it skips the
+        per-field validation pass entirely.
+
+        :param value: Validated processor to wrap.
+        :return: Wrapper.
+        """
+        return cls.model_construct(value=value)
+
+
+def _discriminate_wrapper(value: Any, /) -> str | None:
+    """Get the processor name out of a raw or validated wrapper.
+
+    This lets pydantic dispatch the wrapper union through a tagged
+    union, i.e. a single hash lookup, instead of attempting every
+    registered wrapper model in order.
+
+    :param value: Raw single-key dictionary or validated wrapper.
+    :return: Processor name, or :py:data:`None` if undeterminable.
+    """
+    if isinstance(value, dict):
+        if len(value) == 1:
+            (name,) = value
+            return name
+
+        return None
+
+    return getattr(value, "_es_processor_name", None)
+
+
+def _dump_wrapper(wrapper: _ESProcessorWrapper, /) -> dict:
+    """Serialize a wrapped processor to its single-key JSON form.
+
+    Serializing the inner processor directly bypasses the wrapper union
+    serializer, whose only role is key dispatch; the nested failure
+    chains still go through the regular pydantic serializers.
+
+    :param wrapper: Wrapper for which to serialize the processor.
+    :return: Single-key dictionary form of the processor.
+    """
+    return {
+        wrapper._es_processor_name: wrapper.value.model_dump(
+            mode="json",
+            by_alias=True,
+            exclude_defaults=True,
+        ),
+    }
+
+
+def _dump_processors(processors: list[_ESProcessorWrapper], /) -> list[dict]:
+    """Serialize a list of wrapped processors.
+
+    :param processors: Wrappers to serialize.
+    :return: Serialized processors.
+    """
+    return list(map(_dump_wrapper, processors))
+
+
+def _convert_wrapper(wrapper: _ESProcessorWrapper, /) -> Processor:
+    """Convert a wrapped ElasticSearch processor.
+
+    This is a plain function usable with :py:func:`map`, which iterates
+    wrapper lists at C level rather than with a Python frame per
+    element.
+
+    :param wrapper: Wrapper for which to convert the processor.
+    :return: Converted processor.
+    """
+    return wrapper.value.convert()
+
 
 class ESProcessor(ABC, BaseModel):
     """ElasticSearch processor.
@@ -105,8 +289,21 @@ class ESProcessor(ABC, BaseModel):
     additional options, and so on.
     """
 
-    model_config = ConfigDict(extra="forbid")
-    """Model configuration."""
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        defer_build=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
+    """Model configuration.
+
+    Processors are read-only once parsed, so instances are frozen, which
+    also makes them hashable, and neither assignments nor instances are
+    ever revalidated. Core schema building for the numerous subclasses
+    is deferred until they are actually used by a parser, rather than
+    paid for all of them at import time.
+    """
 
     description: str | None = None
     if_: Annotated[str | None, Field(alias="if")] = None
@@ -114,23 +311,50 @@ class ESProcessor(ABC, BaseModel):
     on_failure: list[_ESProcessorWrapper] | None = None
     tag: str | None = None
 
+    _condition: Annotated[
+        PainlessCondition | None,
+        PrivateAttr(default=None),
+    ]
+    """Condition parsed from :py:attr:`if_`, once at validation time.
+
+    This avoids re-parsing the script on every :py:meth:`build` call for
+    processors that are converted more than once.
+    """
+
+    _common_kwargs: Annotated[dict[str, Any], PrivateAttr()]
+    """Common build arguments, pre-assembled at validation time.
+
+    The on_failure processors stay out of this dictionary, as their
+    conversion recurses and must remain lazy.
+    """
+
+    @model_validator(mode="after")
+    def _precompute_common_kwargs(self, /) -> ESProcessor:
+        """Parse the condition and pre-assemble the common arguments."""
+        if self.if_ is not None:
+            self._condition = PainlessCondition(script=self.if_)
+
+        self._common_kwargs = {
+            "description": self.description,
+            "condition": self._condition,
+            "ignore_failure": self.ignore_failure,
+            "tag": self.tag,
+        }
+        return self
+
     def build(self, cls: type[_ProcessorType], /, **kwargs) -> _ProcessorType:
         """Obtain a Mustash processor out of the current processor.
 
         This also manages common parameters for all processors.
         """
+        on_failure, common_kwargs = _BUILD_ATTRS(self)
         return cls(
-            description=self.description,
-            condition=(
-                PainlessCondition(self.if_) if self.if_ is not None else None
-            ),
-            ignore_failure=self.ignore_failure,
             on_failure=(
-                [proc.value.convert() for proc in self.on_failure]
-                if self.on_failure is not None
+                list(map(_convert_wrapper, on_failure))
+                if on_failure is not None
                 else None
             ),
-            tag=self.tag,
+            **common_kwargs,
             **kwargs,
         )
 
@@ -144,8 +368,27 @@ class ESProcessor(ABC, BaseModel):
         raise NotImplementedError()
 
 
-# HACK: Fix the circular dependency.
-_ESProcessorWrapper.model_rebuild()
+_wrapper_rebuilt = False
+_wrapper_rebuild_lock = Lock()
+
+
+def _ensure_wrapper_rebuilt() -> None:
+    """Resolve the recursive wrapper schema, once, on first use.
+
+    The wrapper model references :py:class:`ESProcessor` circularly, and
+    resolving the forward reference requires a full schema rebuild;
+    doing it lazily keeps the module import cheap for callers that never
+    build a parser.
+    """
+    global _wrapper_rebuilt
+
+    if _wrapper_rebuilt:
+        return
+
+    with _wrapper_rebuild_lock:
+        if not _wrapper_rebuilt:
+            _ESProcessorWrapper.model_rebuild()
+            _wrapper_rebuilt = True
 
 
 # ---
@@ -164,20 +407,36 @@ class ESAppendProcessor(ESProcessor):
     """
 
     field: str
-    value: Element | list[Element]
+    value: list[Element] | Element
+    """Value or values to append.
+
+    The list shape comes first in the union, so that the common case of
+    a list payload validates without first attempting, and failing, the
+    scalar element branch.
+    """
+
     allow_duplicates: bool = True
 
+    _values: Annotated[list[Element], PrivateAttr()]
+    """Value normalized into a list, once at validation time."""
+
+    @model_validator(mode="after")
+    def _normalize_value(self, /) -> ESAppendProcessor:
+        """Normalize the scalar-or-list value."""
+        self._values = (
+            self.value if isinstance(self.value, list) else [self.value]
+        )
+        return self
+
     def convert(self, /) -> Processor:
         """Convert the ElasticSearch processor into a Mustash processor.
 
         :return: Converted processor.
         """
         return self.build(
-            AppendProcessor,
+            _processors().AppendProcessor,
             field=self.field,
-            values=self.value
-            if isinstance(self.value, list)
-            else [self.value],
+            values=self._values,
             allow_duplicates=self.allow_duplicates,
         )
 
@@ -202,7 +461,7 @@ class ESBytesProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            BytesProcessor,
+            _processors().BytesProcessor,
             field=self.field,
             target_field=self.target_field,
             ignore_missing=self.ignore_missing,
@@ -219,15 +478,15 @@ class ESCommunityIDProcessor(ESProcessor):
         community-id-processor.html
     """
 
-    source_ip: str = "source.ip"
-    source_port: str = "source.port"
-    destination_ip: str = "destination.ip"
-    destination_port: str = "destination.port"
-    iana_number: str = "network.iana_number"
-    icmp_type: str = "icmp.type"
-    icmp_code: str = "icmp.code"
-    transport: str = "network.transport"
-    target_field: str = "network.community_id"
+    source_ip: str = _F_SOURCE_IP
+    source_port: str = _F_SOURCE_PORT
+    destination_ip: str = _F_DESTINATION_IP
+    destination_port: str = _F_DESTINATION_PORT
+    iana_number: str = _F_IANA_NUMBER
+    icmp_type: str = _F_ICMP_TYPE
+    icmp_code: str = _F_ICMP_CODE
+    transport: str = _F_TRANSPORT
+    target_field: str = _F_COMMUNITY_ID
     seed: Annotated[int, Ge(0), Lt(65536)] = 0
     ignore_missing: bool = True
 
@@ -237,7 +496,7 @@ class ESCommunityIDProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            CommunityIDProcessor,
+            _processors().CommunityIDProcessor,
             target_field=self.target_field,
             source_ip_field=self.source_ip,
             source_port_field=self.source_port,
@@ -245,7 +504,7 @@ class ESCommunityIDProcessor(ESProcessor):
             destination_port_field=self.destination_port,
             iana_number_field=self.iana_number,
             icmp_type_field=self.icmp_type,
-            icmp_code_field=self.icmp_code_field,
+            icmp_code_field=self.icmp_code,
             transport_field=self.transport,
             seed=self.seed,
             ignore_missing=self.ignore_missing,
@@ -281,56 +540,69 @@ class ESConvertProcessor(ESProcessor):
 
         :return: Converted processor.
         """
-        if self.type == "integer":
-            return IntegerProcessor(
-                field=self.field,
-                target_field=self.target_field,
-                ignore_missing=self.ignore_missing,
-                min=-(2**31),
-                max=2**31 - 1,
-            )
-        elif self.type == "long":
-            return IntegerProcessor(
-                field=self.field,
-                target_field=self.target_field,
-                ignore_missing=self.ignore_missing,
-                min=-(2**63),
-                max=2**63 - 1,
-            )
-        elif self.type == "float":
-            return FloatingPointProcessor(
-                field=self.field,
-                target_field=self.target_field,
-                ignore_missing=self.ignore_missing,
-                precision="half",
-            )
-        elif self.type == "double":
-            return FloatingPointProcessor(
-                field=self.field,
-                target_field=self.target_field,
-                ignore_missing=self.ignore_missing,
-                precision="double",
-            )
-        elif self.type == "string":
-            return StringProcessor(
-                field=self.field,
-                target_field=self.target_field,
-                ignore_missing=self.ignore_missing,
-            )
-        elif self.type == "boolean":
-            return BooleanProcessor(
-                field=self.field,
-                target_field=self.target_field,
-                ignore_missing=self.ignore_missing,
-            )
-        elif self.type == "ip":
-            return IPAddressProcessor(
-                field=self.field,
-                target_field=self.target_field,
-                ignore_missing=self.ignore_missing,
-            )
-
-        raise NotImplementedError()
+        try:
+            factory = _CONVERT_PROCESSOR_FACTORIES[self.type]
+        except KeyError:
+            raise NotImplementedError() from None
+
+        return factory(self)
+
+
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+_CONVERT_PROCESSOR_FACTORIES: dict[
+    str,
+    Callable[[ESConvertProcessor], Processor],
+] = {
+    "integer": lambda proc: _processors().IntegerProcessor(
+        field=proc.field,
+        target_field=proc.target_field,
+        ignore_missing=proc.ignore_missing,
+        min=_INT32_MIN,
+        max=_INT32_MAX,
+    ),
+    "long": lambda proc: _processors().IntegerProcessor(
+        field=proc.field,
+        target_field=proc.target_field,
+        ignore_missing=proc.ignore_missing,
+        min=_INT64_MIN,
+        max=_INT64_MAX,
+    ),
+    "float": lambda proc: _processors().FloatingPointProcessor(
+        field=proc.field,
+        target_field=proc.target_field,
+        ignore_missing=proc.ignore_missing,
+        precision="half",
+    ),
+    "double": lambda proc: _processors().FloatingPointProcessor(
+        field=proc.field,
+        target_field=proc.target_field,
+        ignore_missing=proc.ignore_missing,
+        precision="double",
+    ),
+    "string": lambda proc: _processors().StringProcessor(
+        field=proc.field,
+        target_field=proc.target_field,
+        ignore_missing=proc.ignore_missing,
+    ),
+    "boolean": lambda proc: _processors().BooleanProcessor(
+        field=proc.field,
+        target_field=proc.target_field,
+        ignore_missing=proc.ignore_missing,
+    ),
+    "ip": lambda proc: _processors().IPAddressProcessor(
+        field=proc.field,
+        target_field=proc.target_field,
+        ignore_missing=proc.ignore_missing,
+    ),
+}
+"""Mustash processor factories for the convert processor, by type.
+
+Dispatching through this table replaces a chain of string comparisons
+per conversion with a single dictionary lookup, with the integer bounds
+computed once at import time.
+"""
 
 
 class ESCSVProcessor(ESProcessor):
@@ -360,7 +632,7 @@ class ESCSVProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            CSVProcessor,
+            _processors().CSVProcessor,
             field=self.field,
             target_fields=self.target_fields,
             separator=self.separator,
@@ -393,34 +665,31 @@ class ESDateProcessor(ESProcessor):
 
         :return: Converted processor.
         """
-        parse_handlers = [
-            ISO8601DateTimeFormatter()
-            if value == "ISO8601"
-            else UNIXDateTimeFormatter()
-            if value == "UNIX"
-            else UNIXMSDateTimeFormatter()
-            if value == "UNIX_MS"
-            else ESTAI64NDateTimeFormatter()
-            if value == "TAI64N"
-            else JavaDateTimeFormatter(
-                pattern=value,
-                locale=self.locale,
-            )
-            for value in self.formats
-        ]
-        if len(parse_handlers) == 1:
-            parse_handler = parse_handlers[0]
+        named_formatters = _named_date_formatters()
+        if len(self.formats) == 1:
+            # Common case of a single format: bypass both the handler
+            # list allocation and the fallback wrapper.
+            value = self.formats[0]
+            parse_handler = named_formatters.get(
+                value,
+            ) or _get_java_date_formatter(value, self.locale)
         else:
-            parse_handler = FallbackDateTimeFormatter(handlers=parse_handlers)
+            parse_handler = _time().FallbackDateTimeFormatter(
+                formatters=[
+                    named_formatters.get(value)
+                    or _get_java_date_formatter(value, self.locale)
+                    for value in self.formats
+                ],
+            )
 
         return self.build(
-            DateProcessor,
+            _processors().DateProcessor,
             field=self.field,
             target_field=self.target_field,
             parse_handler=parse_handler,
-            output_handler=JavaDateTimeFormatter(
-                pattern=self.output_format,
-                locale=self.locale,
+            output_handler=_get_java_date_formatter(
+                self.output_format,
+                self.locale,
             ),
             timezone=self.timezone,
         )
@@ -460,6 +729,15 @@ class ESDissectProcessor(ESProcessor):
     append_separator: str = ""
     ignore_missing: bool = False
 
+    @field_validator("pattern", mode="before")
+    @classmethod
+    def _parse_pattern(cls, value: Any, /) -> Any:
+        """Parse string patterns through the shared pattern cache."""
+        if isinstance(value, str):
+            return _parse_dissect_pattern_cached(value)
+
+        return value
+
 
 class ESDotExpander(ESProcessor):
     """ElasticSearch dot expander processor.
@@ -536,15 +814,9 @@ class ESGeoIPProcessor(ESProcessor):
     field: str
     target_field: str = "@timestamp"
     database_file: str = "GeoLite2-City.mmdb"
-    properties: list[str] = [
-        "continent_name",
-        "country_iso_code",
-        "country_name",
-        "region_iso_code",
-        "region_name",
-        "city_name",
-        "location",
-    ]
+    properties: list[str] = Field(
+        default_factory=lambda: list(_GEOIP_DEFAULT_PROPERTIES),
+    )
     ignore_missing: bool = False
     download_database_on_pipeline_creation: bool = True
 
@@ -637,7 +909,7 @@ class ESJSONProcessor(ESProcessor):
         :return: Converted processor.
         """
         # TODO: Not all keys are transposed into the Mustash processor.
-        return JsonProcessor(
+        return _processors().JsonProcessor(
             field=self.field,
             target_field=self.target_field,
             add_to_root=self.add_to_root,
@@ -666,6 +938,15 @@ class ESKVProcessor(ESProcessor):
     trim_value: str = ""
     strip_brackets: bool = False
 
+    @field_validator("field_split", "value_split", mode="before")
+    @classmethod
+    def _compile_patterns(cls, value: Any, /) -> Any:
+        """Compile string patterns through the shared pattern cache."""
+        if isinstance(value, str):
+            return _compile_pattern_cached(value)
+
+        return value
+
 
 class ESLowercaseProcessor(ESProcessor):
     """ElasticSearch lowercase processor.
@@ -687,7 +968,7 @@ class ESLowercaseProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            LowercaseProcessor,
+            _processors().LowercaseProcessor,
             field=self.field,
             target_field=self.target_field,
             ignore_missing=self.ignore_missing,
@@ -704,9 +985,9 @@ class ESNetworkDirectionProcessor(ESProcessor):
         network-direction-processor.html
     """
 
-    source_ip: str = "source.ip"
-    destination_ip: str = "destination.ip"
-    target_field: str = "network.direction"
+    source_ip: str = _F_SOURCE_IP
+    destination_ip: str = _F_DESTINATION_IP
+    target_field: str = _F_NETWORK_DIRECTION
     internal_networks: list[str] | None = None
     internal_networks_field: str | None = None
     ignore_missing: bool = True
@@ -772,12 +1053,27 @@ class ESRemoveProcessor(ESProcessor):
     ignore_missing: bool = False
     keep: str | list[str] | None = None
 
+    _fields: Annotated[list[str] | None, PrivateAttr(default=None)]
+    """Fields normalized into a list, once at validation time."""
+
+    _keep: Annotated[list[str] | None, PrivateAttr(default=None)]
+    """Kept fields normalized into a list, once at validation time."""
+
     @model_validator(mode="after")
     def _validate(self, /) -> ESRemoveProcessor:
         """Validate the model."""
         if (self.field is None) == (self.keep is None):
             raise ValueError("Either field or keep must be defined.")
 
+        if self.field is not None:
+            self._fields = (
+                self.field if isinstance(self.field, list) else [self.field]
+            )
+        if self.keep is not None:
+            self._keep = (
+                self.keep if isinstance(self.keep, list) else [self.keep]
+            )
+
         return self
 
     def convert(self, /) -> Processor:
@@ -785,21 +1081,15 @@ class ESRemoveProcessor(ESProcessor):
 
         :return: Converted processor.
         """
-        if self.keep is not None:
+        if self._keep is not None:
             return self.build(
-                KeepProcessor,
-                fields=(
-                    self.keep if isinstance(self.keep, list) else [self.keep]
-                ),
+                _processors().KeepProcessor,
+                fields=self._keep,
             )
-        elif self.field is not None:
+        elif self._fields is not None:
             return self.build(
-                RemoveProcessor,
-                fields=(
-                    self.field
-                    if isinstance(self.field, list)
-                    else [self.field]
-                ),
+                _processors().RemoveProcessor,
+                fields=self._fields,
                 ignore_missing=self.ignore_missing,
             )
         else:  # pragma: no cover
@@ -886,7 +1176,7 @@ class ESSetProcessor(ESProcessor):
         """
         if self.value is not None:
             return self.build(
-                SetProcessor,
+                _processors().SetProcessor,
                 field=self.field,
                 value=self.value,
                 override=self.override,
@@ -894,7 +1184,7 @@ class ESSetProcessor(ESProcessor):
             )
         elif self.copy_from is not None:
             return self.build(
-                CopyProcessor,
+                _processors().CopyProcessor,
                 field=self.copy_from,
                 target_field=self.field,
                 override=self.override,
@@ -915,16 +1205,9 @@ class ESSetSecurityUserProcessor(ESProcessor):
     """
 
     field: str
-    properties: list[str] = [
-        "username",
-        "roles",
-        "email",
-        "full_name",
-        "metadata",
-        "api_key",
-        "realm",
-        "authentication_type",
-    ]
+    properties: list[str] = Field(
+        default_factory=lambda: list(_SET_SECURITY_USER_DEFAULT_PROPERTIES),
+    )
 
 
 class ESSortProcessor(ESProcessor):
@@ -947,7 +1230,7 @@ class ESSortProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            SortProcessor,
+            _processors().SortProcessor,
             field=self.field,
             target_field=self.target_field,
             order=self.order,
@@ -970,13 +1253,22 @@ class ESSplitProcessor(ESProcessor):
     ignore_missing: bool = False
     preserve_trailing: bool = False
 
+    @field_validator("separator", mode="before")
+    @classmethod
+    def _compile_patterns(cls, value: Any, /) -> Any:
+        """Compile string patterns through the shared pattern cache."""
+        if isinstance(value, str):
+            return _compile_pattern_cached(value)
+
+        return value
+
     def convert(self, /) -> Processor:
         """Convert the ElasticSearch processor into a Mustash processor.
 
         :return: Converted processor.
         """
         return self.build(
-            RegexpSplitProcessor,
+            _processors().RegexpSplitProcessor,
             field=self.field,
             target_field=self.target_field,
             separator=self.separator,
@@ -1005,7 +1297,7 @@ class ESTrimProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            TrimProcessor,
+            _processors().TrimProcessor,
             field=self.field,
             target_field=self.target_field,
             ignore_missing=self.ignore_missing,
@@ -1032,7 +1324,7 @@ class ESUppercaseProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            UppercaseProcessor,
+            _processors().UppercaseProcessor,
             field=self.field,
             target_field=self.target_field,
             ignore_missing=self.ignore_missing,
@@ -1061,7 +1353,7 @@ class ESURIPartsProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            URIPartsProcessor,
+            _processors().URIPartsProcessor,
             field=self.field,
             target_field=self.target_field,
             keep_original=self.keep_original,
@@ -1090,7 +1382,7 @@ class ESURLDecodeProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            URLDecodeProcessor,
+            _processors().URLDecodeProcessor,
             field=self.field,
             target_field=self.target_field,
             ignore_missing=self.ignore_missing,
@@ -1130,7 +1422,7 @@ class ESUserAgentProcessor(ESProcessor):
         :return: Converted processor.
         """
         return self.build(
-            UserAgentProcessor,
+            _processors().UserAgentProcessor,
             field=self.field,
             target_field=self.target_field,
             regex_file=self.regex_file,
@@ -1157,23 +1449,172 @@ class _ESPipeline(BaseModel):
     """Failure processor list."""
 
 
+@lru_cache(maxsize=32)
+def _build_parser_internals(
+    processors_key: frozenset[tuple[str, type[ESProcessor]]],
+    /,
+    *,
+    enable_on_failure: bool = True,
+) -> tuple[dict[str, type[_ESProcessorWrapper]], TypeAdapter, TypeAdapter]:
+    """Build the dynamic models and type adapters for a processor set.
+
+    Synthesizing one pydantic model per processor and compiling the two
+    type adapters dominates parser construction cost; identical
+    processor sets, e.g. tweaked copies of the default parser, share one
+    set of compiled internals through this cache.
+
+    :param processors_key: Processor mapping, as a hashable frozenset
+        of its items.
+    :param enable_on_failure: Whether to support failure chains; when
+        disabled, the on_failure options are rejected and the schema
+        tree shrinks considerably.
+    :return: Wrapper models by name, processor list type adapter, and
+        pipeline-or-list type adapter.
+    """
+    _ensure_wrapper_rebuilt()
+    processors = dict(processors_key)
+
+    # This bit is quite the complicated type stuff, to delegate as much
+    # as we can to pydantic's parsing facilities.
+    # The steps here are the following:
+    #
+    # 1. We define "es_processor_models" as the dictionary of names to
+    #    overridden models to replace ``list[ESProcessor]`` (base class)
+    #    with an indirect reference to ``es_processor_list`` we're going
+    #    to define later.
+    # 2. We define "es_processor_wrappers" as the sequence of
+    #    models wrapping processors into a dictionary where the processor
+    #    definition is indexed by the processor name, in order to match
+    #    e.g. ``{"my_processor": {...}}``. The processor data will always
+    #    be accessible by the key ``value``; see usage of this in
+    #    :py:meth:`convert`.
+    # 3. We define our "es_processor_list" type as the list of our
+    #    processor wrappers.
+    # 4. We rebuild the models defined at step 1 to include a concrete
+    #    definition of the wrapper list.
+
+    on_failure_override: tuple[Any, Any]
+    if enable_on_failure:
+        on_failure_override = (
+            Union["es_processor_list", None],
+            Field(default=None),
+        )
+    else:
+        on_failure_override = (None, Field(default=None))
+
+    es_processor_models = {
+        name: create_model(
+            typ.__name__,
+            on_failure=on_failure_override,
+            __base__=typ,
+        )
+        for name, typ in processors.items()
+    }
+
+    es_processor_wrappers = {
+        name: create_model(
+            f"{typ.__name__}Wrapper",
+            value=(typ, Field(alias=name)),
+            __base__=_ESProcessorWrapper,
+        )
+        for name, typ in es_processor_models.items()
+    }
+    for wrapper_name, wrapper_model in es_processor_wrappers.items():
+        wrapper_model._es_processor_name = wrapper_name
+
+    es_processor_list = TypeAliasType(
+        "es_processor_list",
+        list[  # type: ignore
+            Annotated[
+                Union[
+                    tuple(
+                        Annotated[wrapper_model, Tag(name)]
+                        for name, wrapper_model in (
+                            es_processor_wrappers.items()
+                        )
+                    )
+                ],
+                Discriminator(_discriminate_wrapper),
+            ]
+        ],
+    )
+
+    for typ in es_processor_models.values():
+        typ.model_rebuild()
+
+    # We can now define our pipeline type, and actually define the
+    # type adapters.
+    if enable_on_failure:
+
+        class ESPipeline(_ESPipeline):
+            """ElasticSearch pipeline, as an object to be parsed."""
+
+            processors: es_processor_list = []
+            """Processor list."""
+
+            on_failure: es_processor_list = []
+            """Failure processor list."""
+
+    else:
+
+        class ESPipeline(_ESPipeline):  # type: ignore[no-redef]
+            """ElasticSearch pipeline, as an object to be parsed."""
+
+            processors: es_processor_list = []
+            """Processor list."""
+
+            on_failure: None = None
+            """Failure processor list, unsupported by this parser."""
+
+    return (
+        es_processor_wrappers,
+        TypeAdapter(es_processor_list),
+        TypeAdapter(Union[ESPipeline, es_processor_list]),
+    )
+
+
 class ESIngestPipelineParser:
     """ElasticSearch ingest pipeline converter for mustash.
 
     :param name: Optional name with which the parser wants to be represented.
     :param processors: Processors supported by the pipeline.
+    :param enable_on_failure: Whether to support failure chains; parsers
+        for pipelines known to carry none can disable this to shrink the
+        compiled schema tree considerably.
     """
 
     __slots__ = (
+        "_enable_on_failure",
         "_name",
+        "_parse_cache",
         "_processors",
         "_processors_type_adapter",
         "_type_adapter",
+        "_dump_processors_json",
+        "_validate_cache",
+        "_validate_failure_cache",
+        "_wrapper_models",
     )
 
+    _CACHE_MAX_SIZE = 128
+    """Maximum number of entries in each result cache."""
+
+    _enable_on_failure: bool
+    """Whether failure chains are supported by this parser."""
+
     _name: str | None
     """Name by which the processor wants to be represented."""
 
+    _parse_cache: dict[str, Pipeline]
+    """Parse results, cached by canonical form of the input."""
+
+    _validate_cache: dict[str, list[dict]]
+    """Processor validation results, cached by canonical form of the input."""
+
+    _validate_failure_cache: dict[str, list[dict]]
+    """Failure processor validation results, cached by canonical form of
+    the input."""
+
     _processors: dict[str, type[ESProcessor]]
     """Processors taken into account when parsing."""
 
@@ -1183,82 +1624,70 @@ class ESIngestPipelineParser:
     _processors_type_adapter: TypeAdapter[list[ESProcessor]]
     """Type adapter with which to serialize processors."""
 
+    _dump_processors_json: Callable[[Any], list[dict]]
+    """Pre-bound JSON-mode dumper for validated processor lists.
+
+    The dumper serializes each wrapped processor directly rather than
+    driving the wrapper union serializer, whose only role is key
+    dispatch.
+    """
+
+    _wrapper_models: dict[str, type[_ESProcessorWrapper]]
+    """Wrapper models by processor name, for direct dispatch.
+
+    Looking the wrapper model up by name replaces pydantic's union
+    resolution, which iterates every registered wrapper, with a single
+    dictionary lookup per processor.
+    """
+
     def __init__(
         self,
         /,
         *,
         name: str | None = None,
         processors: dict[str, type[ESProcessor]] | None = None,
+        enable_on_failure: bool = True,
     ) -> None:
         processors = processors or {}
-
-        # This bit is quite the complicated type stuff, to delegate as much
-        # as we can to pydantic's parsing facilities.
-        # The steps here are the following:
-        #
-        # 1. We define "es_processor_models" as the dictionary of names to
-        #    overridden models to replace ``list[ESProcessor]`` (base class)
-        #    with an indirect reference to ``es_processor_list`` we're going
-        #    to define later.
-        # 2. We define "es_processor_wrappers" as the sequence of
-        #    models wrapping processors into a dictionary where the processor
-        #    definition is indexed by the processor name, in order to match
-        #    e.g. ``{"my_processor": {...}}``. The processor data will always
-        #    be accessible by the key ``value``; see usage of this in
-        #    :py:meth:`convert`.
-        # 3. We define our "es_processor_list" type as the list of our
-        #    processor wrappers.
-        # 4. We rebuild the models defined at step 1 to include a concrete
-        #    definition of the wrapper list.
-
-        es_processor_models = {
-            name: create_model(
-                typ.__name__,
-                on_failure=(
-                    Union["es_processor_list", None],
-                    Field(default=None),
-                ),
-                __base__=typ,
-            )
-            for name, typ in processors.items()
-        }
-
-        es_processor_wrappers = tuple(
-            create_model(
-                f"{typ.__name__}Wrapper",
-                value=(typ, Field(alias=name)),
-                __base__=_ESProcessorWrapper,
-            )
-            for name, typ in es_processor_models.items()
+        (
+            es_processor_wrappers,
+            processors_type_adapter,
+            type_adapter,
+        ) = _build_parser_internals(
+            frozenset(processors.items()),
+            enable_on_failure=enable_on_failure,
         )
 
-        es_processor_list = TypeAliasType(
-            "es_processor_list",
-            list[Union[es_processor_wrappers]],  # type: ignore
-        )
-
-        for typ in es_processor_models.values():
-            typ.model_rebuild()
-
-        # We can now define our pipeline type, and actually define the
-        # type adapter.
-        class ESPipeline(_ESPipeline):
-            """ElasticSearch pipeline, as an object to be parsed."""
-
-            processors: es_processor_list = []
-            """Processor list."""
-
-            on_failure: es_processor_list = []
-            """Failure processor list."""
-
         self._name = name
+        self._enable_on_failure = enable_on_failure
         self._processors = processors.copy()
-        self._processors_type_adapter = TypeAdapter(es_processor_list)
-        self._type_adapter = TypeAdapter(Union[ESPipeline, es_processor_list])
+        self._processors_type_adapter = processors_type_adapter
+        self._type_adapter = type_adapter
+        self._wrapper_models = es_processor_wrappers
+        self._dump_processors_json = _dump_processors
+        self._parse_cache = {}
+        self._validate_cache = {}
+        self._validate_failure_cache = {}
 
     def __repr__(self, /) -> str:
         return self._name or object.__repr__(self)
 
+    @staticmethod
+    def _get_cache_key(raw: Any, /) -> str | None:
+        """Get the cache key for a raw pipeline or processor list.
+
+        :param raw: Raw input to compute the key for.
+        :return: Canonical string form of the input, or :py:data:`None`
+            if the input cannot be used as a cache key.
+        """
+        if isinstance(raw, str):
+            return raw
+
+        try:
+            return json_dumps(raw, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+
     def copy(
         self,
         /,
@@ -1275,77 +1704,140 @@ class ESIngestPipelineParser:
             current parser.
         :return: New parser with the modified processors.
         """
-        processors = self._processors.copy()
+        without = (
+            frozenset(without_processors)
+            if without_processors is not None
+            else frozenset()
+        )
+        processors = {
+            **{
+                key: value
+                for key, value in self._processors.items()
+                if key not in without
+            },
+            **(with_processors or {}),
+        }
 
-        if without_processors is not None:
-            for key in without_processors:
-                processors.pop(key, None)
+        return self.__class__(
+            processors=processors,
+            enable_on_failure=self._enable_on_failure,
+        )
 
-        if with_processors is not None:
-            for key, value in with_processors.items():
-                processors[key] = value
+    def _validate_raw(
+        self,
+        raw: Any,
+        /,
+    ) -> _ESPipeline | list[_ESProcessorWrapper]:
+        """Validate a raw pipeline or processor list.
+
+        Python lists of single-key processor dictionaries dispatch the
+        wrapper model directly by processor name, rather than letting
+        pydantic try every registered wrapper in the union; other shapes
+        go through the general type adapter. JSON input is parsed and
+        validated in a single pydantic-core pass, and may be provided as
+        str, bytes or bytearray, so network buffers can be handed over
+        without a decode round trip.
+
+        :param raw: Pipeline or processor list dictionary, or
+            JSON-encoded version of the same as str, bytes or bytearray.
+        :return: Validated object.
+        """
+        if isinstance(raw, (str, bytes, bytearray)):
+            return self._type_adapter.validate_json(raw)
+
+        if isinstance(raw, list):
+            wrapper_models = self._wrapper_models
+            wrappers: list[_ESProcessorWrapper] = []
+            for item in raw:
+                if not isinstance(item, dict) or len(item) != 1:
+                    break
+
+                (processor_name,) = item
+                wrapper_model = wrapper_models.get(processor_name)
+                if wrapper_model is None:
+                    break
 
-        return self.__class__(processors=processors)
+                wrappers.append(wrapper_model.model_validate(item))
+            else:
+                return wrappers
+
+        return self._type_adapter.validate_python(raw)
 
     def validate_processors(self, raw: Any, /) -> list[dict]:
         """Validate the provided pipeline's processors.
 
         :param raw: Pipeline or processor list dictionary, or
-            JSON-encoded version of the same.
+            JSON-encoded version of the same as str, bytes or bytearray.
         :return: Validated object, as Python.
         """
-        if isinstance(raw, str):
-            obj = self._type_adapter.validate_json(raw)
-        else:
-            obj = self._type_adapter.validate_python(raw)
+        key = self._get_cache_key(raw)
+        if key is not None and key in self._validate_cache:
+            return deepcopy(self._validate_cache[key])
+
+        obj = self._validate_raw(raw)
 
         if isinstance(obj, list):
             processors = obj
         else:
             processors = obj.processors
 
-        return self._processors_type_adapter.dump_python(
-            processors,
-            mode="json",
-            by_alias=True,
-            exclude_defaults=True,
-        )
+        result = self._dump_processors_json(processors)
+
+        if key is not None:
+            if len(self._validate_cache) >= self._CACHE_MAX_SIZE:
+                self._validate_cache.clear()
+
+            self._validate_cache[key] = deepcopy(result)
+
+        return result
 
     def validate_failure_processors(self, raw: Any, /) -> list[dict]:
         """Validate the provided pipeline's failure processors.
 
         :param raw: Pipeline or processor list dictionary, or
-            JSON-encoded version of the same.
+            JSON-encoded version of the same as str, bytes or bytearray.
         :return: Validated object, as Python.
+        :raises NotImplementedError: Failure chains are disabled on this
+            parser.
         """
-        if isinstance(raw, str):
-            obj = self._type_adapter.validate_json(raw)
-        else:
-            obj = self._type_adapter.validate_python(raw)
+        if not self._enable_on_failure:
+            raise NotImplementedError(
+                "Failure chains are disabled on this parser.",
+            )
+
+        key = self._get_cache_key(raw)
+        if key is not None and key in self._validate_failure_cache:
+            return deepcopy(self._validate_failure_cache[key])
+
+        obj = self._validate_raw(raw)
 
         if isinstance(obj, list):
             processors = obj
         else:
             processors = obj.on_failure
 
-        return self._processors_type_adapter.dump_python(
-            processors,
-            mode="json",
-            by_alias=True,
-            exclude_defaults=True,
-        )
+        result = self._dump_processors_json(processors)
+
+        if key is not None:
+            if len(self._validate_failure_cache) >= self._CACHE_MAX_SIZE:
+                self._validate_failure_cache.clear()
+
+            self._validate_failure_cache[key] = deepcopy(result)
+
+        return result
 
     def parse(self, raw: Any, /) -> Pipeline:
         """Convert a raw list of processors into a pipeline.
 
         :param raw: Pipeline or processor list dictionary, or
-            JSON-encoded version of the same.
+            JSON-encoded version of the same as str, bytes or bytearray.
         :return: Decoded processor.
         """
-        if isinstance(raw, str):
-            obj = self._type_adapter.validate_json(raw)
-        else:
-            obj = self._type_adapter.validate_python(raw)
+        key = self._get_cache_key(raw)
+        if key is not None and key in self._parse_cache:
+            return self._parse_cache[key].model_copy(deep=True)
+
+        obj = self._validate_raw(raw)
 
         if isinstance(obj, list):
             name: str | None = None
@@ -1355,58 +1847,90 @@ class ESIngestPipelineParser:
             processors = obj.processors
 
         # TODO: Read on_failure processors.
-        return Pipeline(
+        pipeline = Pipeline(
             name=name,
-            processors=[proc.value.convert() for proc in processors],
+            processors=list(map(_convert_wrapper, processors)),
         )
 
+        if key is not None:
+            if len(self._parse_cache) >= self._CACHE_MAX_SIZE:
+                self._parse_cache.clear()
+
+            self._parse_cache[key] = pipeline.model_copy(deep=True)
+
+        return pipeline
+
+
+_DEFAULT_INGEST_PIPELINE_PROCESSORS: dict[str, type[ESProcessor]] = {
+    "append": ESAppendProcessor,
+    "bytes": ESBytesProcessor,
+    "community_id": ESCommunityIDProcessor,
+    "convert": ESConvertProcessor,
+    "csv": ESCSVProcessor,
+    "date": ESDateProcessor,
+    "date_index_name": ESDateIndexNameProcessor,
+    "dissect": ESDissectProcessor,
+    "dot_expander": ESDotExpander,
+    "drop": ESDropProcessor,
+    "fail": ESFailProcessor,
+    "fingerprint": ESFingerprintProcessor,
+    "geoip": ESGeoIPProcessor,
+    "grok": ESGrokProcessor,
+    "gsub": ESGsubProcessor,
+    "html_strip": ESHTMLStripProcessor,
+    "join": ESJoinProcessor,
+    "json": ESJSONProcessor,
+    "kv": ESKVProcessor,
+    "lowercase": ESLowercaseProcessor,
+    "network_direction": ESNetworkDirectionProcessor,
+    "redact": ESRedactProcessor,
+    "registered_domain": ESRegisteredDomainProcessor,
+    "remove": ESRemoveProcessor,
+    "rename": ESRenameProcessor,
+    "reroute": ESRerouteProcessor,
+    "script": ESScriptProcessor,
+    "set": ESSetProcessor,
+    "set_security_user": ESSetSecurityUserProcessor,
+    "sort": ESSortProcessor,
+    "split": ESSplitProcessor,
+    "trim": ESTrimProcessor,
+    "uppercase": ESUppercaseProcessor,
+    "urldecode": ESURLDecodeProcessor,
+    "uri_parts": ESURIPartsProcessor,
+    "user_agent": ESUserAgentProcessor,
+}
+"""Processors for the default ElasticSearch ingest pipeline parser."""
+
+
+@lru_cache(maxsize=1)
+def _get_default_ingest_pipeline_parser() -> ESIngestPipelineParser:
+    """Get the default ElasticSearch ingest pipeline parser.
+
+    The parser instance defines all of the default processors available
+    in all contexts, including on ElasticSearch and in Logstash's
+    ``elastic_integration`` filter. It is built lazily, on first use, as
+    its construction compiles the full processor schema graph.
+
+    :return: Default parser.
+    """
+    return ESIngestPipelineParser(
+        name="DEFAULT_INGEST_PIPELINE_PARSER",
+        processors=_DEFAULT_INGEST_PIPELINE_PROCESSORS,
+    )
 
-DEFAULT_INGEST_PIPELINE_PARSER = ESIngestPipelineParser(
-    name="DEFAULT_INGEST_PIPELINE_PARSER",
-    processors={
-        "append": ESAppendProcessor,
-        "bytes": ESBytesProcessor,
-        "community_id": ESCommunityIDProcessor,
-        "convert": ESConvertProcessor,
-        "csv": ESCSVProcessor,
-        "date": ESDateProcessor,
-        "date_index_name": ESDateIndexNameProcessor,
-        "dissect": ESDissectProcessor,
-        "dot_expander": ESDotExpander,
-        "drop": ESDropProcessor,
-        "fail": ESFailProcessor,
-        "fingerprint": ESFingerprintProcessor,
-        "geoip": ESGeoIPProcessor,
-        "grok": ESGrokProcessor,
-        "gsub": ESGsubProcessor,
-        "html_strip": ESHTMLStripProcessor,
-        "join": ESJoinProcessor,
-        "json": ESJSONProcessor,
-        "kv": ESKVProcessor,
-        "lowercase": ESLowercaseProcessor,
-        "network_direction": ESNetworkDirectionProcessor,
-        "redact": ESRedactProcessor,
-        "registered_domain": ESRegisteredDomainProcessor,
-        "remove": ESRemoveProcessor,
-        "rename": ESRenameProcessor,
-        "reroute": ESRerouteProcessor,
-        "script": ESScriptProcessor,
-        "set": ESSetProcessor,
-        "set_security_user": ESSetSecurityUserProcessor,
-        "sort": ESSortProcessor,
-        "split": ESSplitProcessor,
-        "trim": ESTrimProcessor,
-        "uppercase": ESUppercaseProcessor,
-        "urldecode": ESURLDecodeProcessor,
-        "uri_parts": ESURIPartsProcessor,
-        "user_agent": ESUserAgentProcessor,
-    },
-)
-"""Default ElasticSearch ingest pipeline parser instance.
 
-This instance defines all of the default processors available in all contexts,
-including on ElasticSearch and in Logstash's ``elastic_integration`` filter.
-"""
+def __getattr__(name: str) -> Any:
+    """Get lazily computed module attributes.
+
+    :param name: Name of the attribute to get.
+    :return: Attribute.
+    """
+    if name == "DEFAULT_INGEST_PIPELINE_PARSER":
+        return _get_default_ingest_pipeline_parser()
+
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}",
+    )
 
 
 # ---
@@ -1418,15 +1942,19 @@ def parse_ingest_pipeline(
     raw: Any,
     /,
     *,
-    parser: ESIngestPipelineParser = DEFAULT_INGEST_PIPELINE_PARSER,
+    parser: ESIngestPipelineParser | None = None,
 ) -> Pipeline:
     """Parse an ElasticSearch ingest pipeline's processors.
 
     :param raw: Raw ingest pipeline to parse the processors from, either
         provided as a dictionary or a raw JSON-encoded string.
-    :param parser: Parser to use to read the pipeline's processors.
+    :param parser: Parser to use to read the pipeline's processors;
+        the default parser is used if not provided.
     :return: Parsed ElasticSearch processors.
     """
+    if parser is None:
+        parser = _get_default_ingest_pipeline_parser()
+
     return parser.parse(raw)
 
 
@@ -1434,15 +1962,19 @@ def validate_ingest_pipeline_processors(
     raw: Any,
     /,
     *,
-    parser: ESIngestPipelineParser = DEFAULT_INGEST_PIPELINE_PARSER,
+    parser: ESIngestPipelineParser | None = None,
 ) -> list[dict]:
     """Validate an ElasticSearch ingest pipeline's processors.
 
     :param raw: Raw ingest pipeline to validate the processors from, either
         provided as a dictionary or a raw JSON-encoded string.
-    :param parser: Parser to use to validate the pipeline's processors.
+    :param parser: Parser to use to validate the pipeline's processors;
+        the default parser is used if not provided.
     :return: Validated ElasticSearch processors.
     """
+    if parser is None:
+        parser = _get_default_ingest_pipeline_parser()
+
     return parser.validate_processors(raw)
 
 
@@ -1450,15 +1982,19 @@ def validate_ingest_pipeline_failure_processors(
     raw: Any,
     /,
     *,
-    parser: ESIngestPipelineParser = DEFAULT_INGEST_PIPELINE_PARSER,
+    parser: ESIngestPipelineParser | None = None,
 ) -> list[dict]:
     """Validate an ElasticSearch ingest pipeline's failure processors.
 
     :param raw: Raw ingest pipeline to validate the failure processors from,
         either provided as a dictionary or a raw JSON-encoded string.
-    :param parser: Parser to use to validate the pipeline's failure processors.
+    :param parser: Parser to use to validate the pipeline's failure
+        processors; the default parser is used if not provided.
     :return: Validated ElasticSearch failure processors.
     """
+    if parser is None:
+        parser = _get_default_ingest_pipeline_parser()
+
     return parser.validate_failure_processors(raw)
 
 
@@ -98,7 +98,7 @@ class PipelineFailureException(Error):
     """Exception that has occurred on the pipeline."""
 
     processor: Processor
-    """Processor on which"""
+    """Processor on which the exception has occurred."""
 
     def __init__(
         self,
@@ -30,10 +30,13 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .core import Pipeline
 
 
-def parse_from_config(raw: str, /) -> Pipeline:
+@lru_cache(maxsize=128)
+def _parse_from_config(raw: str, /) -> Pipeline:
     """Parse the pipeline from a logstash pipeline.
 
     :param raw: Raw logstash configuration to read the processors from.
@@ -42,6 +45,19 @@ def parse_from_config(raw: str, /) -> Pipeline:
     raise NotImplementedError()  # TODO
 
 
+def parse_from_config(raw: str, /) -> Pipeline:
+    """Parse the pipeline from a logstash pipeline.
+
+    Parse results are cached by raw source, so that configurations
+    parsed many times only pay the parsing cost once. Since pipelines
+    are mutable, a deep copy of the cached pipeline is returned.
+
+    :param raw: Raw logstash configuration to read the processors from.
+    :return: Pipeline.
+    """
+    return _parse_from_config(raw).model_copy(deep=True)
+
+
 def render_as_filter(pipeline: Pipeline, /) -> list:
     """Render a list of processors as a Logstash filter body.
 
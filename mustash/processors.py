@@ -30,20 +30,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from csv import (
     Dialect as CSVDialect,
-    DictReader as CSVDictReader,
     QUOTE_MINIMAL as CSV_QUOTE_MINIMAL,
+    reader as csv_reader,
 )
-from datetime import tzinfo
-from io import StringIO
+from datetime import datetime, tzinfo
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 import re
 import struct
 from typing import Annotated, ClassVar, Literal, Self
 
 from annotated_types import Ge, Lt
-from pydantic import StringConstraints, model_validator
+from pydantic import PrivateAttr, StringConstraints, model_validator
 from pydantic_core import from_json
 
 from .core import Document, Element, FieldPath, FieldProcessor, Processor
@@ -52,6 +53,58 @@ from .time import DateTimeFormatter
 from .utils import CommunityID, CommunityIDTransport
 
 
+@lru_cache(maxsize=128)
+def _get_csv_dialect(separator: str, quote: str, /) -> type[CSVDialect]:
+    """Get the CSV dialect for a separator and quote couple, with caching.
+
+    Identically configured processors share one dialect class; besides
+    saving the class synthesis, this keeps such processors equal, as
+    pydantic compares private attributes.
+
+    :param separator: Single-character separator used in CSV.
+    :param quote: Single-character quote used in CSV.
+    :return: Dialect type.
+    """
+    return type(
+        "_CSVProcessorDialect",
+        (CSVDialect,),
+        {
+            "delimiter": separator,
+            "quotechar": quote,
+            "lineterminator": "\n",
+            "quoting": CSV_QUOTE_MINIMAL,
+        },
+    )
+
+
+def _reduce_field_subset(fields: set[FieldPath], /) -> set[FieldPath]:
+    """Reduce a set of field paths to the greatest containing scopes.
+
+    Paths contained by another path of the set are discarded, so that
+    only the widest scopes remain. Processing the paths from shortest to
+    longest against a set of kept prefixes makes this linear in the
+    total number of path parts, instead of quadratic in the number of
+    paths.
+
+    :param fields: Paths to reduce.
+    :return: Reduced paths.
+    """
+    reduced: set[FieldPath] = set()
+    kept_parts: set[tuple[str, ...]] = set()
+
+    for field in sorted(fields, key=lambda field: len(field.parts)):
+        parts = field.parts
+        if any(parts[:i] in kept_parts for i in range(1, len(parts) + 1)):
+            # A path of the set contains this one (or equals it), and
+            # has already been kept.
+            continue
+
+        kept_parts.add(parts)
+        reduced.add(field)
+
+    return reduced
+
+
 class AppendProcessor(Processor):
     """Processor for adding values to a list / array."""
 
@@ -75,17 +128,51 @@ class AppendProcessor(Processor):
                 f"Targeted field was of type {type(lst)}, not a list",
             )
 
+        values = self.values
         if self.allow_duplicates:
-            lst.extend(self.values)
-        else:
-            for value in self.values:
-                if value not in lst:
-                    lst.append(value)
+            lst.extend(values)
+            return
+
+        try:
+            existing = set(lst)
+        except TypeError:
+            # Unhashable elements in the target list; fall back on the
+            # linear membership test.
+            existing = None
+
+        for value in values:
+            if existing is not None:
+                try:
+                    if value in existing:
+                        continue
+
+                    existing.add(value)
+                except TypeError:
+                    if value in lst:
+                        continue
+            elif value in lst:
+                continue
+
+            lst.append(value)
 
 
 class BooleanProcessor(FieldProcessor):
     """Processor for converting a value into a boolean."""
 
+    _VALUES: ClassVar[dict[str, bool]] = {
+        "true": True,
+        "True": True,
+        "TRUE": True,
+        "false": False,
+        "False": False,
+        "FALSE": False,
+    }
+    """Accepted raw values in their common spellings.
+
+    A direct lookup here handles the dominant cases without allocating a
+    casefolded copy of the value.
+    """
+
     async def process(self, value: Element, /) -> bool:
         """Process the field into the expected type.
 
@@ -93,10 +180,12 @@ class BooleanProcessor(FieldProcessor):
         :return: Processed value.
         """
         if isinstance(value, str):
-            if value.casefold() == "true":
-                return True
-            elif value.casefold() == "false":
-                return False
+            result = self._VALUES.get(value)
+            if result is None:
+                result = self._VALUES.get(value.casefold())
+
+            if result is not None:
+                return result
 
         raise ValueError(f"Could not convert to boolean: {value!r}")
 
@@ -134,6 +223,19 @@ class BytesProcessor(FieldProcessor[str]):
     }
     """Available unit factors for bytes."""
 
+    _PATTERN: ClassVar[re.Pattern] = re.compile(
+        r"\s*([+-]?(?:\d+(?:\.\d+)?|\.\d+)(?:[eE][+-]?\d+)?)"
+        r"\s*([kmgtp]b?|b)\s*",
+        re.I,
+    )
+    """Pattern matching a number followed by a unit.
+
+    A single pass of this pattern replaces up to eleven endswith probes
+    plus slicing and stripping per value. The number group accepts every
+    shape float() does, including bare fractions and exponents, as
+    ElasticSearch's byte-size parsing does.
+    """
+
     async def process(self, value: str, /) -> int:
         """Get the number of bytes from the given field.
 
@@ -150,19 +252,17 @@ class BytesProcessor(FieldProcessor[str]):
             # Units are required for all values except these.
             return int(value)
 
-        value = value.casefold()
-        for unit, factor in self._UNIT_FACTORS.items():
-            if value.endswith(unit):
-                break
-        else:
+        match = self._PATTERN.fullmatch(value)
+        if match is None:
             raise ValueError(f"Missing or unrecognized unit: {value}")
 
-        value = value[: -len(unit)].rstrip()
+        number = match[1]
+        factor = self._UNIT_FACTORS[match[2].casefold()]
 
-        try:
-            return int(value) * factor
-        except ValueError:
-            return int(float(value) * factor)
+        if "." in number or "e" in number or "E" in number:
+            return int(float(number) * factor)
+
+        return int(number) * factor
 
 
 class CommunityIDProcessor(Processor):
@@ -310,29 +410,35 @@ class CopyProcessor(Processor):
 
         :param document: Document to which to apply the processor.
         """
+        # Hoist the attribute reads used more than once into locals, as
+        # every pydantic model attribute access pays dictionary lookups.
+        field = self.field
+        target_field = self.target_field
+        ignore_empty_value = self.ignore_empty_value
+
         try:
-            value = self.field.get(document)
+            value = field.get(document)
         except KeyError:
-            if self.ignore_empty_value:
+            if ignore_empty_value:
                 return
 
             raise
 
-        if self.ignore_empty_value and (value is None or value == ""):
+        if ignore_empty_value and (value is None or value == ""):
             return
 
         if not self.override:
             try:
-                self.target_field.get(document)
+                target_field.get(document)
             except KeyError:
                 pass
             else:
                 return
 
-        self.target_field.set(document, value)
+        target_field.set(document, value)
 
         if self.remove_if_successful:
-            self.field.delete(document)
+            field.delete(document)
 
 
 class CSVProcessor(Processor):
@@ -373,6 +479,15 @@ class CSVProcessor(Processor):
     empty_value: str = ""
     """Value used to fill empty fields."""
 
+    _dialect: Annotated[type[CSVDialect], PrivateAttr]
+    """Dialect shared by processors with the same separator and quote."""
+
+    @model_validator(mode="after")
+    def _build_dialect(self, /) -> Self:
+        """Bind the CSV dialect once, rather than per document."""
+        self._dialect = _get_csv_dialect(self.separator, self.quote)
+        return self
+
     async def apply(self, document: Document, /) -> None:
         """Apply the processor to the document, in-place.
 
@@ -386,23 +501,10 @@ class CSVProcessor(Processor):
 
             raise
 
-        class dialect(CSVDialect):
-            delimiter = self.separator
-            quotechar = self.quote
-            lineterminator = "\n"
-            quoting = CSV_QUOTE_MINIMAL
-
-        reader = CSVDictReader(
-            StringIO(raw_line),
-            fieldnames=self.target_fields,
-            dialect=dialect,
-        )
-        result = next(reader)
-        if None in result:
-            del result[None]
-
-        for field, value in result.items():
-            field.set(document, value)
+        row = next(csv_reader((raw_line,), dialect=self._dialect))
+        row_length = len(row)
+        for i, field in enumerate(self.target_fields):
+            field.set(document, row[i] if i < row_length else None)
 
 
 class DateProcessor(FieldProcessor):
@@ -428,17 +530,42 @@ class DateProcessor(FieldProcessor):
     timezone: tzinfo
     """Timezone to use when parsing the date."""
 
+    _parse: Annotated[Callable[[Element], datetime], PrivateAttr]
+    """Parse entry point, bound once at validation time."""
+
+    _parse_string: Annotated[Callable[[str], datetime], PrivateAttr]
+    """Memoized parse entry point for string values.
+
+    Logs commonly repeat identical timestamps within a batch; caching
+    the parse by raw string amortizes them.
+    """
+
+    _format: Annotated[Callable[[datetime], Element], PrivateAttr]
+    """Format entry point, bound once at validation time."""
+
+    @model_validator(mode="after")
+    def _bind_handlers(self, /) -> Self:
+        """Bind the handler entry points once at validation time."""
+        self._parse = self.parse_handler.parse
+        self._parse_string = lru_cache(maxsize=4096)(self._parse)
+        self._format = self.output_handler.format
+        return self
+
     async def process(self, value: Element, /) -> Element:
         """Process the field into the expected type.
 
         :param value: Value to process.
         :return: Processed value.
         """
-        dt = self.parse_handler.parse(value)
+        if isinstance(value, str):
+            dt = self._parse_string(value)
+        else:
+            dt = self._parse(value)
+
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=self.timezone)
 
-        return self.output_handler.format(dt)
+        return self._format(dt)
 
 
 class DropProcessor(Processor):
@@ -449,6 +576,10 @@ class DropProcessor(Processor):
 
         :param document: Document to which to apply the processor.
         """
+        # A fresh exception per drop is deliberate: re-raising a shared
+        # instance chains traceback frames onto it forever, retaining
+        # every dropped document, and is unsafe for callers that keep
+        # the caught exception around.
         raise DropException()
 
 
@@ -458,6 +589,27 @@ class FloatingPointProcessor(FieldProcessor):
     precision: Literal["half", "double"]
     """Precision expected for the target field."""
 
+    def process_batch(self, values: list, /) -> list:
+        """Process several values synchronously.
+
+        The whole batch is converted with a single pack/unpack couple,
+        rather than two struct calls and a bytes allocation per value.
+
+        :param values: Values to process.
+        :return: Processed values, in the order of the provided values.
+        """
+        floats = list(map(float, values))
+        if self.precision == "half":
+            count = len(floats)
+            return list(
+                struct.unpack(
+                    f"{count}f",
+                    struct.pack(f"{count}f", *floats),
+                ),
+            )
+
+        return floats
+
     async def process(self, value: Element, /) -> float:
         """Process the field into the expected type.
 
@@ -482,32 +634,66 @@ class IntegerProcessor(FieldProcessor):
     min: int | None = None
     """Minimum accepted number, included."""
 
+    _check: Annotated[Callable[[int], int], PrivateAttr]
+    """Bound check specialized for the configured bounds.
+
+    The closure matching the configured bounds is picked once at
+    validation time, so the per-value hot path no longer re-tests which
+    bounds are set.
+    """
+
+    @model_validator(mode="after")
+    def _compile_check(self, /) -> Self:
+        """Specialize the bound check for the configured bounds."""
+        minimum, maximum = self.min, self.max
+
+        if minimum is None and maximum is None:
+
+            def check(value: int, /) -> int:
+                return value
+
+        elif maximum is None:
+
+            def check(value: int, /) -> int:
+                if value < minimum:  # type: ignore[operator]
+                    raise ValueError(
+                        "Value must be greater than or equal to "
+                        + f"{minimum}",
+                    )
+
+                return value
+
+        elif minimum is None:
+
+            def check(value: int, /) -> int:
+                if value > maximum:
+                    raise ValueError(
+                        f"Value must be less than or equal to {maximum}",
+                    )
+
+                return value
+
+        else:
+
+            def check(value: int, /) -> int:
+                if value < minimum or value > maximum:
+                    raise ValueError(
+                        f"Value must be between {minimum} and {maximum} "
+                        + "included.",
+                    )
+
+                return value
+
+        self._check = check
+        return self
+
     async def process(self, value: Element, /) -> int:
         """Process the field into the expected type.
 
         :param value: Value to process.
         :return: Processed value.
         """
-        value = int(value)  # type: ignore
-
-        if (self.min is not None and value < self.min) or (
-            self.max is not None and value > self.max
-        ):
-            if self.min is None:
-                raise ValueError(
-                    f"Value must be less than or equal to {self.min}",
-                )
-            elif self.max is None:
-                raise ValueError(
-                    f"Value must be greater than or equal to {self.max}",
-                )
-            else:
-                raise ValueError(
-                    f"Value must be between {self.min} and {self.max} "
-                    + "included.",
-                )
-
-        return value
+        return self._check(int(value))  # type: ignore[arg-type]
 
 
 class IPAddressProcessor(FieldProcessor):
@@ -519,6 +705,15 @@ class IPAddressProcessor(FieldProcessor):
         :param value: Value to process.
         :return: Processed value.
         """
+        if isinstance(value, str):
+            # Every IPv6 textual form contains a colon and no IPv4 form
+            # does, so dispatch on it directly instead of letting the
+            # IPv4 constructor fail and raise first.
+            if ":" in value:
+                return IPv6Address(value)
+
+            return IPv4Address(value)
+
         try:
             return IPv4Address(value)
         except ValueError:
@@ -560,10 +755,13 @@ class JsonProcessor(Processor):
 
         :param document: Document to which to apply the processor.
         """
-        value = self.field.get(document)
+        field = self.field
+        target_field = self.target_field
+
+        value = field.get(document)
         if not isinstance(value, str):
             raise TypeError(
-                f"Invalid type {type(value)} for field {self.field}",
+                f"Invalid type {type(value)} for field {field}",
             )
 
         result = from_json(value)
@@ -571,13 +769,12 @@ class JsonProcessor(Processor):
             raise ValueError(f"Parsed field was not an array: {result}")
 
         if self.add_to_root:
-            for key, value in result.items():
-                # TODO: allow_duplicates?
-                document[key] = value
-        elif self.target_field is not None:
-            self.target_field.set(document, result)
+            # TODO: allow_duplicates?
+            document.update(result)
+        elif target_field is not None:
+            target_field.set(document, result)
         else:
-            self.field.set(document, result)
+            field.set(document, result)
 
 
 class KeepProcessor(Processor):
@@ -604,24 +801,7 @@ class KeepProcessor(Processor):
         We want to obtain a subset of the paths to avoid paths containing
         each other here, and only keep the greatest scope.
         """
-        fields: set[FieldPath] = set()
-        for field in self.fields:
-            # Two cases here:
-            # * If we find a path in the already added paths that is contained
-            #   by the new path, we remove it.
-            # * If we find a path that contains the new path, we just discard
-            #   the new path.
-            for sub_field in list(fields):
-                if field in sub_field:
-                    # We treat this case first, as if field == sub_field,
-                    # we want to prioritize discarding the new field.
-                    break
-                elif sub_field in field:
-                    fields.remove(sub_field)
-            else:
-                fields.add(field)
-
-        self.fields = fields
+        self.fields = _reduce_field_subset(self.fields)
         return self
 
     async def apply(self, document: Document, /) -> None:
@@ -646,6 +826,14 @@ class LowercaseProcessor(FieldProcessor[str]):
         plugins-filters-mutate.html#plugins-filters-mutate-lowercase
     """
 
+    def process_batch(self, values: list, /) -> list:
+        """Process several values synchronously.
+
+        :param values: Values to process.
+        :return: Processed values, in the order of the provided values.
+        """
+        return list(map(str.lower, values))
+
     async def process(self, value: str, /) -> str:
         """Process the field into the expected type.
 
@@ -682,24 +870,7 @@ class RemoveProcessor(Processor):
         We want to obtain a subset of the paths to avoid paths containing
         each other here, and only keep the greatest scope.
         """
-        fields: set[FieldPath] = set()
-        for field in self.fields:
-            # Two cases here:
-            # * If we find a path in the already added paths that is contained
-            #   by the new path, we remove it.
-            # * If we find a path that contains the new path, we just discard
-            #   the new path.
-            for sub_field in list(fields):
-                if field in sub_field:
-                    # We treat this case first, as if field == sub_field,
-                    # we want to prioritize discarding the new field.
-                    break
-                elif sub_field in field:
-                    fields.remove(sub_field)
-            else:
-                fields.add(field)
-
-        self.fields = fields
+        self.fields = _reduce_field_subset(self.fields)
         return self
 
     async def apply(self, document: Document, /) -> None:
@@ -743,14 +914,28 @@ class SetProcessor(Processor):
     ignore_empty_value: bool = False
     """Whether not to set an empty value."""
 
+    _is_noop: Annotated[bool, PrivateAttr]
+    """Whether the processor does nothing at all.
+
+    Both operands of the empty-value check are immutable model options,
+    so the outcome is decided once at validation time instead of per
+    document.
+    """
+
+    @model_validator(mode="after")
+    def _precompute_noop(self, /) -> Self:
+        """Constant-fold the empty-value check."""
+        self._is_noop = self.ignore_empty_value and (
+            self.value is None or self.value == ""
+        )
+        return self
+
     async def apply(self, document: Document, /) -> None:
         """Apply the processor to the document, in-place.
 
         :param document: Document to which to apply the processor.
         """
-        if self.ignore_empty_value and (
-            self.value is None or self.value == ""
-        ):
+        if self._is_noop:
             return
 
         self.field.set(document, self.value, override=self.override)
@@ -814,19 +999,8 @@ class RegexpSplitProcessor(FieldProcessor[str]):
         values.append(value[last_index:])
 
         if not self.preserve_trailing:
-            try:
-                last_not_empty_index = next(
-                    i
-                    for i, value in zip(
-                        range(len(values) - 1, -1, -1),
-                        values[::-1],
-                    )
-                    if value
-                )
-            except StopIteration:
-                values[:] = []
-            else:
-                values[last_not_empty_index + 1 :] = []
+            while values and not values[-1]:
+                values.pop()
 
         return values
 
@@ -864,7 +1038,7 @@ class TrimProcessor(FieldProcessor[str | list[str]]):
         :return: Processed value.
         """
         if isinstance(value, list):
-            return [x.strip() for x in value]
+            return list(map(str.strip, value))
 
         return value.strip()
 
@@ -883,6 +1057,14 @@ class UppercaseProcessor(FieldProcessor[str]):
         plugins-filters-mutate.html#plugins-filters-mutate-uppercase
     """
 
+    def process_batch(self, values: list, /) -> list:
+        """Process several values synchronously.
+
+        :param values: Values to process.
+        :return: Processed values, in the order of the provided values.
+        """
+        return list(map(str.upper, values))
+
     async def process(self, value: str, /) -> str:
         """Process the field into the expected type.
 
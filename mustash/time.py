@@ -31,29 +31,125 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
-import re
+from sys import version_info
 from typing import Annotated, ClassVar
 
 from annotated_types import MinLen
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from .core import Element
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+"""UNIX Epoch, shared by the timestamp-based formatters."""
+
+_FROMISOFORMAT_HANDLES_Z = version_info >= (3, 11)
+"""Whether :py:meth:`datetime.datetime.fromisoformat` accepts ``Z``.
+
+Before Python 3.11, the dominant ``Z``-suffixed timestamp shape had to
+be rewritten with an explicit offset before parsing.
+"""
+
+
 class DateTimeFormatter(BaseModel, ABC):
     """Date and time parser and formatter."""
 
-    model_config = ConfigDict(extra="forbid")
-    """Model configuration."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    """Model configuration.
+
+    Formatters carry no mutable state besides private caches, so
+    instances are frozen and can safely be shared, e.g. as singletons
+    across converted processors.
+    """
+
+    ACCEPTS: ClassVar[tuple[type, ...]] = (
+        str,
+        int,
+        float,
+        bytes,
+        bytearray,
+        memoryview,
+    )
+    """Value types the formatter may accept.
+
+    Chains such as the fallback formatter use this to skip formatters
+    that obviously cannot parse a value, without attempting them.
+    """
 
-    @abstractmethod
     def parse(self, value: Element, /) -> datetime:
         """Extract a date and time from a value.
 
+        The value type is dispatched on here, once, so that subclasses
+        implement typed hooks instead of re-checking the type on every
+        call.
+
         :param value: Value to extract the date and time from.
         :return: Timezone-aware date and time.
+        :raises TypeError: The value type is not supported by the
+            formatter.
+        """
+        if isinstance(value, str):
+            return self._parse_string(value)
+        if isinstance(value, (int, float)):
+            return self._parse_number(value)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            # Values straight off a socket or log file are a single
+            # ASCII decode away from the string hook; decoding here
+            # saves every caller an upstream conversion.
+            return self._parse_string(bytes(value).decode("ascii"))
+
+        raise TypeError(f"Unsupported value type: {type(value)}")
+
+    def try_parse(self, value: Element, /) -> datetime | None:
+        """Extract a date and time from a value, without raising.
+
+        Chains probing several formatters use this to test a formatter
+        without exception-driven control flow at the call site;
+        subclasses with a cheap rejection test may override it to skip
+        raising altogether.
+
+        :param value: Value to extract the date and time from.
+        :return: Timezone-aware date and time, or :py:data:`None` if the
+            value could not be parsed.
         """
+        try:
+            return self.parse(value)
+        except (TypeError, ValueError):
+            return None
+
+    def parse_many(self, values: Iterable[Element], /) -> list[datetime]:
+        """Extract dates and times from several values.
+
+        The default implementation maps :py:meth:`parse` over the batch
+        at C level; subclasses may specialize further.
+
+        :param values: Values to extract the dates and times from.
+        :return: Timezone-aware dates and times, in the order of the
+            provided values.
+        """
+        return list(map(self.parse, values))
+
+    def _parse_string(self, value: str, /) -> datetime:
+        """Extract a date and time from a string value.
+
+        :param value: Value to extract the date and time from.
+        :return: Timezone-aware date and time.
+        :raises TypeError: String values are not supported by the
+            formatter.
+        """
+        raise TypeError(f"Unsupported value type: {type(value)}")
+
+    def _parse_number(self, value: int | float, /) -> datetime:
+        """Extract a date and time from a numeric value.
+
+        :param value: Value to extract the date and time from.
+        :return: Timezone-aware date and time.
+        :raises TypeError: Numeric values are not supported by the
+            formatter.
+        """
+        raise TypeError(f"Unsupported value type: {type(value)}")
 
     @abstractmethod
     def format(self, value: datetime, /) -> Element:
@@ -70,18 +166,37 @@ class FallbackDateTimeFormatter(DateTimeFormatter):
     formatters: Annotated[list[DateTimeFormatter], MinLen(1)]
     """Date and time formatters to use, as a chain."""
 
+    _last_successful_index: Annotated[int, PrivateAttr(default=0)]
+    """Index of the formatter that last parsed successfully.
+
+    Values in a stream usually share one format, so trying the last
+    winner first skips the failed parse attempts, and their exception
+    cost, of the formatters before it in the chain.
+    """
+
     def parse(self, value: Element, /) -> datetime:
         """Extract a date and time from a value.
 
         :param value: Value to extract the date and time from.
         :return: Timezone-aware date and time.
         """
-        for formatter in self.formatters:
-            try:
-                return formatter.parse(value)
-            except ValueError:
+        formatters = self.formatters
+        count = len(formatters)
+        start = self._last_successful_index
+
+        for offset in range(count):
+            index = (start + offset) % count
+            formatter = formatters[index]
+            if not isinstance(value, formatter.ACCEPTS):
+                continue
+
+            result = formatter.try_parse(value)
+            if result is None:
                 continue
 
+            self._last_successful_index = index
+            return result
+
         raise ValueError(
             "None of the formatters have successfully extracted the "
             + "date and time.",
@@ -97,7 +212,17 @@ class FallbackDateTimeFormatter(DateTimeFormatter):
 
 
 class JavaDateTimeFormatter(DateTimeFormatter):
-    """Java date and time formatter."""
+    """Java date and time formatter.
+
+    .. note::
+
+        Parsing and formatting are not implemented yet. When they are,
+        the pattern must be compiled once at model validation time, into
+        a compiled regular expression and specialized parse and format
+        callables stored on private attributes, rather than interpreted
+        on every call; generic strptime-style interpretation is dozens
+        of times slower than a specialized parser for a known format.
+    """
 
     pattern: str
     """Java time pattern to extract the date and time with.
@@ -115,14 +240,41 @@ class JavaDateTimeFormatter(DateTimeFormatter):
 class ISO8601DateTimeFormatter(DateTimeFormatter):
     """ISO 8601 date and time formatter."""
 
-    def parse(self, value: Element, /) -> datetime:
-        """Extract a date and time from a value.
+    ACCEPTS: ClassVar[tuple[type, ...]] = (str, bytes, bytearray, memoryview)
+    """Value types the formatter may accept."""
+
+    def parse_many(self, values: Iterable[Element], /) -> list[datetime]:
+        """Extract dates and times from several values.
+
+        When the interpreter parses ``Z`` suffixes natively, string
+        values go straight through
+        :py:meth:`datetime.datetime.fromisoformat`, amortizing the
+        Python-level dispatch over the whole batch; other value types,
+        such as bytes, keep going through :py:meth:`parse` for its type
+        dispatch.
+
+        :param values: Values to extract the dates and times from.
+        :return: Timezone-aware dates and times, in the order of the
+            provided values.
+        """
+        if _FROMISOFORMAT_HANDLES_Z:
+            return [
+                datetime.fromisoformat(value)
+                if isinstance(value, str)
+                else self.parse(value)
+                for value in values
+            ]
+
+        return list(map(self.parse, values))
+
+    def _parse_string(self, value: str, /) -> datetime:
+        """Extract a date and time from a string value.
 
         :param value: Value to extract the date and time from.
         :return: Timezone-aware date and time.
         """
-        if not isinstance(value, str):
-            raise TypeError()
+        if not _FROMISOFORMAT_HANDLES_Z and value.endswith("Z"):
+            value = value[:-1] + "+00:00"
 
         return datetime.fromisoformat(value)
 
@@ -138,14 +290,21 @@ class ISO8601DateTimeFormatter(DateTimeFormatter):
 class UNIXDateTimeFormatter(DateTimeFormatter):
     """UNIX timestamp formatter with second granularity."""
 
-    def parse(self, value: Element, /) -> datetime:
-        """Extract a date and time from a value.
+    def _parse_string(self, value: str, /) -> datetime:
+        """Extract a date and time from a string value.
 
         :param value: Value to extract the date and time from.
         :return: Timezone-aware date and time.
         """
-        value = float(value)  # type: ignore
-        return datetime.fromtimestamp(value, UTC)
+        return _EPOCH + timedelta(seconds=float(value))
+
+    def _parse_number(self, value: int | float, /) -> datetime:
+        """Extract a date and time from a numeric value.
+
+        :param value: Value to extract the date and time from.
+        :return: Timezone-aware date and time.
+        """
+        return _EPOCH + timedelta(seconds=value)
 
     def format(self, value: datetime, /) -> Element:
         """Format a date and time.
@@ -159,14 +318,21 @@ class UNIXDateTimeFormatter(DateTimeFormatter):
 class UNIXMSDateTimeFormatter(DateTimeFormatter):
     """UNIX timestamp formatter with millisecond granularity."""
 
-    def parse(self, value: Element, /) -> datetime:
-        """Extract a date and time from a value.
+    def _parse_string(self, value: str, /) -> datetime:
+        """Extract a date and time from a string value.
+
+        :param value: Value to extract the date and time from.
+        :return: Timezone-aware date and time.
+        """
+        return _EPOCH + timedelta(milliseconds=int(float(value)))
+
+    def _parse_number(self, value: int | float, /) -> datetime:
+        """Extract a date and time from a numeric value.
 
         :param value: Value to extract the date and time from.
         :return: Timezone-aware date and time.
         """
-        value = int(float(value)) / 1000  # type: ignore
-        return datetime.fromtimestamp(value, UTC)
+        return _EPOCH + timedelta(milliseconds=int(value))
 
     def format(self, value: datetime, /) -> Element:
         """Format a date and time.
@@ -220,32 +386,41 @@ class ESTAI64NDateTimeFormatter(DateTimeFormatter):
     .. _`TAI64, TAI64N, and TAI64NA`: https://cr.yp.to/libtai/tai64.html
     """
 
-    _PATTERN: ClassVar[re.Pattern] = re.compile(
-        r"@?([0-9a-fA-F]{16})([0-9a-fA-F]{8})",
-    )
-    """Pattern used for parsing raw elements."""
+    ACCEPTS: ClassVar[tuple[type, ...]] = (str, bytes, bytearray, memoryview)
+    """Value types the formatter may accept."""
 
-    def parse(self, value: Element, /) -> datetime:
-        """Extract a date and time from a value.
+    def _parse_string(self, value: str, /) -> datetime:
+        """Extract a date and time from a string value.
 
         :param value: Value to extract the date and time from.
         :return: Timezone-aware date and time.
         """
-        if not isinstance(value, str):
-            raise TypeError()
-
-        match = self._PATTERN.fullmatch(value)
-        if match is None:
+        raw = value[1:] if value[:1] == "@" else value
+        if len(raw) != 24:
             raise ValueError()
 
-        seconds = int(match[1], 16)
-        if seconds & 9223372036854775808:  # 2^63, reserved.
+        # bytes.fromhex raises ValueError on non-hexadecimal input, just
+        # as the previous pattern check did, while decoding in a single
+        # C pass. It skips ASCII spaces however, so the decoded length
+        # must be checked as well for the twelve bytes to be guaranteed.
+        data = bytes.fromhex(raw)
+        if len(data) != 12:
             raise ValueError()
-        if seconds & 4611686018427387904:  # 2^62, negative.
-            seconds -= 9223372036854775808
 
-        nanoseconds = int(match[2], 16)
-        return datetime(1970, 1, 1, tzinfo=UTC) + timedelta(
+        # Let from_bytes sign-extend bit 63, so the reserved-bit and
+        # sign tests become plain comparisons instead of masks against
+        # 64-bit constants.
+        seconds = int.from_bytes(data[:8], signed=True)
+        if seconds < 0:  # Bit 63 set, reserved.
+            raise ValueError()
+        if seconds >= 1 << 62:  # Bit 62 set, negative.
+            seconds -= 1 << 63
+
+        nanoseconds = int.from_bytes(data[8:12])
+        # The float division is deliberate: timedelta rounds the
+        # fractional microseconds to the nearest whole one, as the
+        # ElasticSearch implementation does.
+        return _EPOCH + timedelta(
             seconds=seconds,
             microseconds=nanoseconds / 1000,
         )
@@ -258,8 +433,10 @@ class ESTAI64NDateTimeFormatter(DateTimeFormatter):
         """
         seconds = int(value.timestamp())
         if seconds < 0:
-            seconds += 9223372036854775808
+            seconds += 1 << 63
 
-        microseconds = value.microsecond * 1000
+        nanoseconds = value.microsecond * 1000
 
-        return f"@{seconds.to_bytes(8).hex()}{microseconds.to_bytes(4).hex()}"
+        # Fixed-width hexadecimal formatting goes straight through the C
+        # integer formatter, with no intermediate bytes objects.
+        return f"@{seconds:016x}{nanoseconds:08x}"
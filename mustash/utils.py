@@ -30,6 +30,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 from typing import Annotated, Any
 
@@ -62,28 +64,39 @@ class Runk(BaseModel):
         :param raw: Raw string to take into account.
         """
         self.offset += len(raw)
-        try:
-            newline_offset = raw.rindex("\n")
-        except ValueError:
+
+        if len(raw) > 4096 and raw.isascii():
+            # For large ASCII chunks, scan the bytes form, whose newline
+            # search goes through the C library's vectorized memchr.
+            data = raw.encode("ascii")
+            newline_offset = data.rfind(b"\n")
+            if newline_offset < 0:
+                self.column += len(raw)
+            else:
+                self.line += data.count(b"\n", 0, newline_offset + 1)
+                self.column = len(raw) - newline_offset
+
+            return
+
+        newline_offset = raw.rfind("\n")
+        if newline_offset < 0:
             self.column += len(raw)
         else:
-            self.line += raw.count("\n")
+            # Bound the count to the last newline, so the scan does not
+            # walk the trailing partial line a second time.
+            self.line += raw.count("\n", 0, newline_offset + 1)
             self.column = len(raw) - newline_offset
 
 
 class NoValueType:
-    """Type for the NO_VALUE constant."""
+    """Type for the NO_VALUE constant.
 
-    __slots__ = ()
+    The constant should always be checked by identity against
+    :py:data:`NO_VALUE`, which is the only instance built by this
+    module.
+    """
 
-    def __new__(cls, *args, **kwargs):
-        """Create or return the NO_VALUE constant."""
-        try:
-            return cls.__unique_value__
-        except AttributeError:
-            value = super().__new__(cls, *args, **kwargs)
-            cls.__unique_value__ = value
-            return value
+    __slots__ = ()
 
     def __repr__(self):
         return "NO_VALUE"
@@ -96,6 +109,50 @@ The type of this value is a singleton.
 """
 
 
+@lru_cache(maxsize=1024)
+def _get_generic_args_for_class(
+    generic: Any,
+    cls: type,
+    /,
+) -> tuple[Any, ...] | None:
+    """Get the generic arguments for a class, with caching.
+
+    The result is a pure function of the class, while callers usually
+    hold instances; caching by class reduces the base walk to a single
+    lookup for classes seen before.
+
+    :param generic: The generic class to detect and extract parameters
+        from.
+    :param cls: The class from which to get the generic class
+        parameters.
+    :return: The generic class parameters, or :py:data:`None` if the
+        class does not inherit from the generic class.
+    """
+    try:
+        bases = deque(cls.__orig_bases__)
+        bases.extend(cls.__bases__)
+    except AttributeError:
+        return None
+
+    # Walk the bases breadth-first in place, rather than allocating a
+    # new list per inheritance level.
+    while bases:
+        base = bases.popleft()
+        if base is generic:
+            break
+
+        origin = get_typing_origin(base)
+        if origin is generic:
+            return get_typing_args(base)
+
+        try:
+            bases.extend(base.__orig_bases__)
+        except AttributeError:
+            pass
+
+    return None
+
+
 def get_generic_args(
     generic: Any,
     value: Any,
@@ -108,30 +165,13 @@ def get_generic_args(
     :return: The generic class parameters.
     :raises TypeError: The value is not an instance of the generic class.
     """
-    try:
-        bases = list(value.__class__.__orig_bases__)
-        bases.extend(value.__class__.__bases__)
-    except AttributeError:
-        pass
-    else:
-        while bases:
-            new_bases = []
-            for base in bases:
-                if base is generic:
-                    break
-
-                origin = get_typing_origin(base)
-                if origin is generic:
-                    return get_typing_args(base)
-
-                try:
-                    new_bases.extend(base.__orig_bases__)
-                except AttributeError:
-                    pass
-
-            bases = new_bases
+    args = _get_generic_args_for_class(generic, value.__class__)
+    if args is None:
+        raise TypeError(
+            f"Value {value!r} is not an instance of {generic!r}.",
+        )
 
-    raise TypeError(f"Value {value!r} is not an instance of {generic!r}.")
+    return args
 
 
 def get_generic_arg(
@@ -152,7 +192,7 @@ def get_generic_arg(
     try:
         (arg,) = get_generic_args(generic, value)
     except TypeError:
-        if isinstance(default, NoValueType):
+        if default is NO_VALUE:
             raise
 
         return default
@@ -30,6 +30,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from pydantic import BaseModel
@@ -129,6 +130,30 @@ def test_field_path_get() -> None:
     assert FieldPath("a.b.c").get({"a": 1}, default="wow") == "wow"
 
 
+def test_field_path_get_many() -> None:
+    """Test that ``FieldPath.get_many`` works."""
+    document = {"a": {"b": "4", "c": 7}, "d": [1]}
+    assert FieldPath.get_many(document, "a.b", "a.c") == ["4", 7]
+    assert FieldPath.get_many(document, "a.b", "a.c", cls=int) == [4, 7]
+    assert FieldPath.get_many(document, FieldPath("d.0"), "a") == [
+        1,
+        {"b": "4", "c": 7},
+    ]
+    assert FieldPath.get_many(document) == []
+
+    with pytest.raises(KeyError, match=r"'a.e'"):
+        FieldPath.get_many(document, "a.b", "a.e.f")
+
+    with pytest.raises(KeyError, match=r"'d.1'"):
+        FieldPath.get_many(document, "d.1")
+
+    with pytest.raises(KeyError, match=r"'d.x'"):
+        FieldPath.get_many(document, "d.x")
+
+    with pytest.raises(KeyError, match=r"'a.b.x'"):
+        FieldPath.get_many(document, "a.b.x")
+
+
 def test_field_path_set() -> None:
     """Test that ``FieldPath.set`` works."""
     d: Document = {"a": {}}
@@ -211,6 +236,58 @@ async def test_pipeline_apply() -> None:
     assert document == {"hello": "world"}
 
 
+@pytest.mark.asyncio
+async def test_pipeline_apply_many() -> None:
+    """Test that a pipeline can apply to several documents."""
+
+    class MyProcessor(Processor):
+        async def apply(self, document: Document, /) -> None:
+            document["hello"] = "world"
+
+    pipeline = Pipeline(processors=[MyProcessor()])
+    documents: list[Document] = [{}, {"other": 1}]
+    await pipeline.apply_many(documents)
+    assert documents == [
+        {"hello": "world"},
+        {"other": 1, "hello": "world"},
+    ]
+
+
+def test_field_processor_process_batch() -> None:
+    """Test that a CPU-only field processor can process batches."""
+
+    class MyProcessor(FieldProcessor[str]):
+        async def process(self, value: str, /) -> str:
+            return value.upper()
+
+    processor = MyProcessor(field="a")
+    assert processor.process_batch(["x", "y"]) == ["X", "Y"]
+    assert processor.process_batch([]) == []
+
+
+def test_processor_apply_sync() -> None:
+    """Test that a CPU-only processor can apply synchronously."""
+
+    class MyProcessor(Processor):
+        async def apply(self, document: Document, /) -> None:
+            document["hello"] = "world"
+
+    document: Document = {}
+    MyProcessor().apply_sync(document)
+    assert document == {"hello": "world"}
+
+
+def test_processor_apply_sync_awaiting() -> None:
+    """Test that a processor that actually awaits cannot apply_sync."""
+
+    class MyAwaitingProcessor(Processor):
+        async def apply(self, document: Document, /) -> None:
+            await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match=r"event loop"):
+        MyAwaitingProcessor().apply_sync({})
+
+
 @pytest.mark.asyncio
 async def test_field_processor() -> None:
     """Test field processors."""
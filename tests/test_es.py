@@ -72,6 +72,40 @@ def test_parse(raw: list, expected: list[Processor]) -> None:
     assert parse_ingest_pipeline(raw).processors == expected
 
 
+def test_parse_community_id() -> None:
+    """Check that the community ID processor converts."""
+    (processor,) = parse_ingest_pipeline(
+        [{"community_id": {"icmp_code": "custom.code"}}],
+    ).processors
+
+    assert processor.icmp_code_field == "custom.code"
+    assert processor.source_ip_field == "source.ip"
+
+
+def test_parse_cached() -> None:
+    """Check that repeated parses yield independent pipelines."""
+    raw = [{"set": {"field": "a.b", "value": "hello"}}]
+    first = parse_ingest_pipeline(raw)
+    second = parse_ingest_pipeline(raw)
+
+    assert first == second
+    assert first is not second
+    assert first.processors[0] is not second.processors[0]
+
+
+def test_validate_cached() -> None:
+    """Check that repeated validations yield independent results."""
+    raw = {
+        "name": "xyz",
+        "processors": [{"set": {"field": "a", "value": "1"}}],
+    }
+    first = validate_ingest_pipeline_processors(raw)
+    second = validate_ingest_pipeline_processors(raw)
+
+    assert first == second
+    assert first is not second
+
+
 @pytest.mark.parametrize(
     "raw",
     (
@@ -154,6 +154,16 @@ async def test_boolean_exc() -> None:
             {"hello": "42.5mb"},
             {"hello": 44564480},
         ),
+        (
+            {"field": "hello"},
+            {"hello": ".5kb"},
+            {"hello": 512},
+        ),
+        (
+            {"field": "hello"},
+            {"hello": "1e3kb"},
+            {"hello": 1024000},
+        ),
     ),
 )
 async def test_bytes(
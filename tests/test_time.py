@@ -75,6 +75,23 @@ def test_iso_8601() -> None:
     )
 
 
+def test_iso_8601_parse_many() -> None:
+    """Test the ISO 8601 formatter on batches."""
+    assert ISO8601DateTimeFormatter().parse_many(
+        ["2024-07-05T16:33:27+00:00", "2024-07-05T16:33:28Z"],
+    ) == [
+        datetime(2024, 7, 5, 16, 33, 27, tzinfo=UTC),
+        datetime(2024, 7, 5, 16, 33, 28, tzinfo=UTC),
+    ]
+    assert ISO8601DateTimeFormatter().parse_many(
+        [b"2024-07-05T16:33:27Z", "2024-07-05T16:33:28Z"],
+    ) == [
+        datetime(2024, 7, 5, 16, 33, 27, tzinfo=UTC),
+        datetime(2024, 7, 5, 16, 33, 28, tzinfo=UTC),
+    ]
+    assert ISO8601DateTimeFormatter().parse_many([]) == []
+
+
 def test_unix_date_time_formatter() -> None:
     """Test the UNIX timestamp formatter."""
     assert UNIXDateTimeFormatter().parse(123.450) == datetime(